@@ -4,17 +4,29 @@ Contains pure data processing functions separated from UI.
 """
 from __future__ import annotations
 
+import bisect
 import calendar
+import csv
 import datetime as dt
+import functools
+import io
 import json as _json
+import math
 import re as _re
-from dataclasses import dataclass, field
+import types
+import warnings
+from collections import OrderedDict
+from dataclasses import InitVar, dataclass, field
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Mapping
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
+
+try:  # Optional: numba-compiled kernels for the seasonal statistics
+    import backend_numba as _nb
+except ImportError:
+    _nb = None
 
 # Use absolute path based on this file's location
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -26,32 +38,135 @@ OFFSET_LIMITS = {"weekly": 6, "monthly": 30}
 NUM_YEARS = 20
 
 MONTH_NAMES = [calendar.month_abbr[i] for i in range(1, 13)]
-
-# In-memory cache for loaded symbol DataFrames to avoid repeated CSV reads.
-# Key: symbol string, Value: (DataFrame, timestamp of last load)
-_symbol_cache: dict[str, pd.DataFrame] = {}
+_MONTH_IDX = {name: i for i, name in enumerate(MONTH_NAMES)}
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)  # non-leap year
+# Calendar days per monthly row label, including the "Jan+" rollover rows
+_MONTH_LABEL_DAYS = {
+    label: days
+    for name, days in zip(MONTH_NAMES, _MONTH_DAYS)
+    for label in (name, f"{name}+")
+}
+
+# In-memory cache for loaded symbol DataFrames to avoid repeated file reads.
+# Key: sanitized symbol, Value: (mtime of the Parquet cache file, DataFrame)
+_symbol_cache: dict[str, tuple[float | None, pd.DataFrame]] = {}
+
+# The memo caches below are LRUs (see _lru_get / _lru_put) whose entries are
+# (source objects, payload): an entry is reused only while every source
+# DataFrame it was built from is still the same object.
+
+# LRU cache of synthesized baskets.
+# Key: tuple of symbols, Value: (component DataFrames, basket DataFrame)
+_basket_cache: OrderedDict[tuple[str, ...], tuple[tuple[pd.DataFrame, ...], pd.DataFrame]] = OrderedDict()
+BASKET_CACHE_SIZE = 16
+
+# LRU memo of derived seasonal analysis so repeated requests (offset/threshold
+# scrubbing, table then export) skip regenerating rows and runs.
+# Key: (symbols, period, offset, threshold), Value: ((source DataFrame,), (years, rows, runs))
+_analysis_cache: OrderedDict[tuple, tuple] = OrderedDict()
+ANALYSIS_CACHE_SIZE = 32
+
+# Seasonal rows depend only on the offset, not the threshold, so they get
+# their own LRU memo: threshold changes and the find_optimal_trades sweep
+# reuse one generate_seasonal_data result per offset.
+# Key: (symbols, period, offset), Value: ((source DataFrame,), rows)
+_rows_cache: OrderedDict[tuple, tuple] = OrderedDict()
+ROWS_CACHE_SIZE = 64
 
 # In-memory cache for sliding window detection results.
 # Key: (symbol, window_size, threshold_pct_int), Value: list[SlidingWindow]
 _window_detect_cache: dict[tuple, list] = {}
 
 
+def _lru_get(cache: OrderedDict, key: tuple, sources: tuple) -> object | None:
+    """
+    Payload cached under key if it was built from these same source objects,
+    marking it most recently used; None on a miss or a stale entry.
+    """
+    entry = cache.get(key)
+    if entry is None or len(entry[0]) != len(sources):
+        return None
+    if not all(cached is source for cached, source in zip(entry[0], sources)):
+        return None
+    cache.move_to_end(key)
+    return entry[1]
+
+
+def _lru_put(cache: OrderedDict, key: tuple, sources: tuple, payload: object, max_size: int) -> None:
+    """Store payload for key, evicting the least recently used entry past max_size."""
+    cache[key] = (sources, payload)
+    cache.move_to_end(key)
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SeasonalRow:
-    """Aggregated seasonal data for a single period position (week # or month name)."""
+    """Aggregated seasonal data for a single period position (week # or month name).
+
+    Per-year returns are stored as parallel ``years`` / ``returns`` arrays
+    (NaN marks a year with no data). ``year_returns`` remains available as a
+    read-only ``{year: return | None}`` view for callers that want the
+    mapping form, and can be passed to the constructor or assigned whole.
+    """
     label: str  # "Week 1", "Week 2", ... or "Jan", "Feb", ...
-    year_returns: dict[int, float | None] = field(default_factory=dict)  # year -> net return %
-    
+    years: tuple[int, ...] = ()  # analysis years, one per entry in `returns`
+    returns: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))  # net return %, NaN = no data
+    year_returns: InitVar[Mapping[int, float | None] | None] = None
+
+    # Cached (average, trend_pct, expected_value); filled in bulk by
+    # generate_seasonal_data or lazily on first access.
+    _stats: tuple | None = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self, year_returns: Mapping[int, float | None] | None) -> None:
+        if year_returns is not None:
+            self._set_year_returns(year_returns)
+
+    def __eq__(self, other: object) -> bool:
+        # ndarray == ndarray is elementwise, so compare returns explicitly
+        # (a missing year equals a missing year, as None == None did)
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.label == other.label
+            and self.years == other.years
+            and np.array_equal(self.returns, other.returns, equal_nan=True)
+        )
+
+    def _get_year_returns(self) -> Mapping[int, float | None]:
+        """Per-year returns as a read-only ``{year: net return % | None}`` mapping."""
+        return types.MappingProxyType({
+            year: None if math.isnan(ret) else ret
+            for year, ret in zip(self.years, self.returns.tolist())
+        })
+
+    def _set_year_returns(self, mapping: Mapping[int, float | None]) -> None:
+        self.years = tuple(mapping)
+        self.returns = np.array(
+            [np.nan if v is None else v for v in mapping.values()], dtype=np.float64
+        )
+        self._stats = None
+
+    def get_year_return(self, year: int) -> float | None:
+        """Net return % for ``year``, or None if the year has no data."""
+        try:
+            ret = self.returns[self.years.index(year)]
+        except ValueError:
+            return None
+        return None if np.isnan(ret) else float(ret)
+
+    def _get_stats(self) -> tuple:
+        if self._stats is None:
+            self._stats = _seasonal_row_stats(self.returns.reshape(1, -1))[0]
+        return self._stats
+
     @property
     def average(self) -> float | None:
-        values = [v for v in self.year_returns.values() if v is not None]
-        if not values:
-            return None
-        return sum(values) / len(values)
+        return self._get_stats()[0]
 
     @property
     def trend_pct(self) -> tuple[float, bool] | None:
@@ -59,32 +174,63 @@ class SeasonalRow:
         Returns (percentage, is_bullish) where percentage is the higher of green% or red%.
         is_bullish is True if green% >= red%, False otherwise.
         """
-        values = [v for v in self.year_returns.values() if v is not None]
-        if not values:
-            return None
-        green_count = sum(1 for v in values if v >= 0)
-        red_count = len(values) - green_count
-        green_pct = (green_count / len(values)) * 100
-        red_pct = (red_count / len(values)) * 100
-        if green_pct >= red_pct:
-            return (green_pct, True)
-        else:
-            return (red_pct, False)
+        return self._get_stats()[1]
 
     @property
     def expected_value(self) -> float | None:
         """Expected value: avg * trend% / 100 (signed by direction)."""
-        avg = self.average
-        trend = self.trend_pct
-        if avg is None or trend is None:
-            return None
-        pct, is_bullish = trend
+        return self._get_stats()[2]
+
+
+# Installed after the dataclass is built: the class attribute of the same
+# name is the year_returns InitVar's default while the decorator runs.
+SeasonalRow.year_returns = property(SeasonalRow._get_year_returns, SeasonalRow._set_year_returns)
+
+
+def _seasonal_row_stats(returns: np.ndarray) -> list[tuple]:
+    """
+    Compute (average, trend_pct, expected_value) for every row of a
+    (n_rows, n_years) returns matrix, NaN marking missing years.
+    """
+    if _nb is not None:
+        counts, avg, trend, is_bull, ev = _nb.seasonal_stats(
+            np.ascontiguousarray(returns, dtype=np.float64)
+        )
+    else:
+        mask = ~np.isnan(returns)
+        counts = mask.sum(axis=1)
+        green = (mask & (np.nan_to_num(returns) >= 0)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg = np.where(mask, returns, 0.0).sum(axis=1) / counts
+            green_pct = (green / counts) * 100
+            red_pct = ((counts - green) / counts) * 100
+        is_bull = green_pct >= red_pct
+        trend = np.where(is_bull, green_pct, red_pct)
         # EV is positive for bullish, negative for bearish
-        direction = 1 if is_bullish else -1
-        return abs(avg) * (pct / 100) * direction
+        ev = np.abs(avg) * (trend / 100) * np.where(is_bull, 1, -1)
+
+    stats: list[tuple] = []
+    for n, a, t, bull, e in zip(
+        counts.tolist(), avg.tolist(), trend.tolist(), is_bull.tolist(), ev.tolist()
+    ):
+        if n == 0:
+            stats.append((None, None, None))
+        else:
+            stats.append((a, (t, bull), e))
+    return stats
 
 
-@dataclass
+def _row_stat_arrays(rows: list[SeasonalRow]) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(average, trend %, is_bullish, expected value) columns for rows, NaN where no data."""
+    stats = [row._get_stats() for row in rows]
+    avg = np.array([np.nan if a is None else a for a, _, _ in stats], dtype=np.float64)
+    trend = np.array([np.nan if t is None else t[0] for _, t, _ in stats], dtype=np.float64)
+    is_bull = np.array([t is not None and t[1] for _, t, _ in stats], dtype=bool)
+    ev = np.array([np.nan if e is None else e for _, _, e in stats], dtype=np.float64)
+    return avg, trend, is_bull, ev
+
+
+@dataclass(slots=True)
 class RunInfo:
     """Information about a run of consecutive bullish/bearish periods."""
     start_idx: int
@@ -93,7 +239,7 @@ class RunInfo:
     ev_sum: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """A simulated trade for a green run."""
     run_idx: int  # which run this is (0-indexed)
@@ -104,7 +250,7 @@ class Trade:
     profit_pct: float  # compounded profit percentage for this trade
 
 
-@dataclass
+@dataclass(slots=True)
 class YearlyTradeResult:
     """Trading simulation results for a single year."""
     year: int
@@ -112,6 +258,8 @@ class YearlyTradeResult:
     total_profit_pct: float  # compounded total profit
     total_days_held: int
     buy_hold_profit_pct: float  # buy and hold for whole year
+    # trades keyed by (entry_period, exit_period) label
+    trades_by_key: dict[tuple[str, str], Trade] = field(default_factory=dict)
 
 
 # =============================================================================
@@ -122,14 +270,32 @@ def load_stock_list() -> list[tuple[str, str]]:
     """Load stock list from cached CSV. Returns list of (symbol, name) tuples."""
     if not STOCKS_FILE.exists():
         return []
-    stocks = []
-    with open(STOCKS_FILE, "r", encoding="utf-8") as f:
-        next(f)  # Skip header
-        for line in f:
-            parts = line.strip().split(",", 1)
-            if len(parts) == 2:
-                stocks.append((parts[0], parts[1]))
-    return stocks
+    return _read_stock_list(STOCKS_FILE, STOCKS_FILE.stat().st_mtime)
+
+
+@functools.lru_cache(maxsize=1)
+def _read_stock_list(path: Path, mtime: float) -> list[tuple[str, str]]:
+    """Parse the stock list once per file version (mtime is the cache key)."""
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # Skip header
+        return [(row[0], ",".join(row[1:])) for row in reader if len(row) >= 2]
+
+
+@functools.lru_cache(maxsize=1)
+def _stock_search_index(path: Path, mtime: float) -> tuple[list[tuple[str, str]], str, list[int]]:
+    """
+    Stock list plus a lowercased search blob with one "symbol\tname" line per
+    stock, and the offset at which each line starts.
+    """
+    stocks = _read_stock_list(path, mtime)
+    lines = [f"{symbol}\t{name}".lower() for symbol, name in stocks]
+    line_starts = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+    return stocks, "\n".join(lines), line_starts
 
 
 def search_symbols(query: str, max_results: int = 10) -> list[dict[str, str]]:
@@ -137,17 +303,24 @@ def search_symbols(query: str, max_results: int = 10) -> list[dict[str, str]]:
     Search for symbols matching query (case-insensitive contains match).
     Returns list of {symbol, name} dicts.
     """
-    stocks = load_stock_list()
     query_lower = query.lower().strip()
-    if not query_lower:
+    if not query_lower or not STOCKS_FILE.exists():
         return []
-    
+    stocks, blob, line_starts = _stock_search_index(STOCKS_FILE, STOCKS_FILE.stat().st_mtime)
+
+    # Scan the blob with str.find (C speed) and map each hit back to its
+    # line; a match may not span the symbol/name separator or a line break.
     matches = []
-    for symbol, name in stocks:
-        if query_lower in symbol.lower() or query_lower in name.lower():
+    pos = blob.find(query_lower)
+    while pos >= 0 and len(matches) < max_results:
+        idx = bisect.bisect_right(line_starts, pos) - 1
+        line_end = line_starts[idx + 1] - 1 if idx + 1 < len(line_starts) else len(blob)
+        if pos + len(query_lower) <= line_end and "\t" not in blob[pos:pos + len(query_lower)]:
+            symbol, name = stocks[idx]
             matches.append({"symbol": symbol, "name": name})
-            if len(matches) >= max_results:
-                break
+            pos = blob.find(query_lower, line_end + 1)
+        else:
+            pos = blob.find(query_lower, pos + 1)
     return matches
 
 
@@ -188,21 +361,38 @@ def ensure_dirs() -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _is_normalized(df: pd.DataFrame) -> bool:
+    """True for a frame already in the shape _normalize_df produces."""
+    return (
+        isinstance(df.index, pd.DatetimeIndex)
+        and df.index.tz is None
+        and list(df.columns) == ["Open", "High", "Low", "Close"]
+        and not df.index.hasnans
+        and not df.isna().to_numpy().any()
+    )
+
+
 def _normalize_df(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df
-    df = df.copy()
+    # Frames already in the target shape (cache files written by
+    # load_symbol_data) skip the relabel/select/dropna passes entirely
+    if _is_normalized(df):
+        return df
+    # Relabel with set_axis rather than assigning to a copy: the caller's
+    # frame is left untouched without first duplicating every column.
+    columns = df.columns
     # Handle multi-level columns from yfinance (Price, Ticker)
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
+    if isinstance(columns, pd.MultiIndex):
+        columns = columns.get_level_values(0)
     # Normalize index to timezone-naive datetime
     idx = pd.to_datetime(df.index, errors="coerce")
     if idx.tz is not None:
         idx = idx.tz_localize(None)
-    df.index = idx
+    df = df.set_axis(idx, axis=0).set_axis([str.title(col) for col in columns], axis=1)
     # Drop rows with NaT in the index (from unparseable dates)
-    df = df[df.index.notna()]
-    df = df.rename(columns=str.title)
+    if idx.hasnans:
+        df = df[idx.notna()]
     # Ensure required columns exist
     required = ["Open", "High", "Low", "Close"]
     missing = [col for col in required if col not in df.columns]
@@ -212,6 +402,9 @@ def _normalize_df(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def _download_symbol(symbol: str, start: dt.date | None = None) -> pd.DataFrame:
+    # yfinance is slow to import; browsing cached data should not pay for it
+    import yfinance as yf
+
     kwargs: dict[str, object] = {"progress": False, "auto_adjust": False}
     if start:
         kwargs["start"] = start
@@ -221,48 +414,162 @@ def _download_symbol(symbol: str, start: dt.date | None = None) -> pd.DataFrame:
     return _normalize_df(df)
 
 
+def _read_cached_csv(cache_path: Path) -> pd.DataFrame:
+    """Read a legacy symbol cache CSV (normalizing is a no-op if it already is)."""
+    return _normalize_df(pd.read_csv(cache_path, index_col=0, parse_dates=[0]))
+
+
+def _read_symbol_cache(symbol_key: str, today: pd.Timestamp) -> tuple[pd.DataFrame, float | None, bool, bool]:
+    """
+    Cached history for a symbol as (frame, parquet mtime, needs_migration, is_fresh).
+    is_fresh means the in-memory copy is current (as of the normalized
+    ``today``) and can be returned as is.
+    The frame is always sorted by date, so its last row is the latest bar.
+    """
+    cache_path = DATA_DIR / f"{symbol_key}.parquet"
+    legacy_path = DATA_DIR / f"{symbol_key}.csv"
+    mtime = cache_path.stat().st_mtime if cache_path.exists() else None
+
+    # Reuse the in-memory frame while the file on disk is unchanged.  It is
+    # fresh if the data is recent (use 4-day window to account for weekends
+    # and holidays), otherwise it seeds the incremental update.
+    entry = _symbol_cache.get(symbol_key)
+    if entry is not None and entry[0] == mtime:
+        cached = entry[1]
+        cutoff = today - pd.Timedelta(days=4)
+        is_fresh = not cached.empty and cached.index[-1].normalize() >= cutoff
+        return cached, mtime, False, is_fresh
+    if mtime is not None:
+        return pd.read_parquet(cache_path, engine="pyarrow"), mtime, False, False
+    if legacy_path.exists():
+        # Older versions cached CSV; convert it to Parquet on first access
+        legacy = _read_cached_csv(legacy_path)
+        if not legacy.index.is_monotonic_increasing:
+            legacy = legacy.sort_index()
+        return legacy, mtime, True, False
+    return pd.DataFrame(), mtime, False, False
+
+
+def _download_start(cached: pd.DataFrame, today: pd.Timestamp) -> tuple[bool, dt.date | None]:
+    """(needs_download, start date) for a cached history; start None means full history."""
+    if cached.empty:
+        return True, None
+    last_date = cached.index[-1].normalize()
+    yesterday = today - pd.Timedelta(days=1)
+    if last_date < yesterday:
+        return True, (last_date + pd.Timedelta(days=1)).date()
+    return False, None
+
+
+def _store_symbol_data(
+    symbol_key: str,
+    cached: pd.DataFrame,
+    downloaded: pd.DataFrame | None,
+    mtime: float | None,
+    migrate: bool,
+) -> pd.DataFrame:
+    """Merge downloaded rows into the cached history and persist it if it changed."""
+    if cached.empty:
+        updated = downloaded if downloaded is not None else cached
+    elif downloaded is None or downloaded.empty:
+        updated = cached
+    else:
+        # Both frames are date-indexed, so keeping only rows past the
+        # cached range is enough to avoid duplicates
+        incremental = downloaded[downloaded.index > cached.index[-1]]
+        updated = cached if incremental.empty else pd.concat([cached, incremental])
+
+    # Only rewrite the cache file when something new was downloaded
+    if updated is not cached or migrate:
+        if not updated.index.is_monotonic_increasing:
+            updated = updated.sort_index()
+        cache_path = DATA_DIR / f"{symbol_key}.parquet"
+        updated.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+        mtime = cache_path.stat().st_mtime
+    _symbol_cache[symbol_key] = (mtime, updated)
+    return updated
+
+
 def load_symbol_data(symbol: str) -> pd.DataFrame:
     ensure_dirs()
     symbol_key = sanitize_symbol(symbol)
-    
-    # Return from in-memory cache if available and data is recent
-    # (use 4-day window to account for weekends and holidays)
-    if symbol_key in _symbol_cache:
-        cached_df = _symbol_cache[symbol_key]
-        cutoff = pd.Timestamp.now().normalize() - pd.Timedelta(days=4)
-        if not cached_df.empty and cached_df.index.max().normalize() >= cutoff:
-            return cached_df
-    
-    cache_path = DATA_DIR / f"{symbol_key}.csv"
-    if cache_path.exists():
-        cached = pd.read_csv(cache_path, index_col=0, parse_dates=True)
-        cached = _normalize_df(cached)
-    else:
-        cached = pd.DataFrame()
+    today = pd.Timestamp.now().normalize()
+    cached, mtime, migrate, is_fresh = _read_symbol_cache(symbol_key, today)
+    if is_fresh:
+        return cached
+    needs_download, start = _download_start(cached, today)
+    downloaded = _download_symbol(symbol, start=start) if needs_download else None
+    return _store_symbol_data(symbol_key, cached, downloaded, mtime, migrate)
 
-    yesterday = pd.Timestamp.now().normalize() - pd.Timedelta(days=1)
-    if cached.empty:
-        updated = _download_symbol(symbol)
-    else:
-        last_date = cached.index.max().normalize()
-        if last_date < yesterday:
-            start_date = (last_date + pd.Timedelta(days=1)).date()
-            incremental = _download_symbol(symbol, start=start_date)
-            updated = pd.concat([cached, incremental]).drop_duplicates()
+
+def load_many_symbols(symbols: Iterable[str]) -> dict[str, pd.DataFrame]:
+    """
+    Load several symbols, fetching all stale ones with a single yf.download.
+    The request starts at the earliest date any of them needs (full history
+    if any has no cache); rows each symbol already has are dropped on merge.
+    """
+    ensure_dirs()
+    loaded: dict[str, pd.DataFrame] = {}
+    pending: dict[str, tuple] = {}
+    # One notion of "today" for the whole batch, even across midnight
+    today = pd.Timestamp.now().normalize()
+    for symbol in dict.fromkeys(symbols):
+        symbol_key = sanitize_symbol(symbol)
+        cached, mtime, migrate, is_fresh = _read_symbol_cache(symbol_key, today)
+        if is_fresh:
+            loaded[symbol] = cached
+            continue
+        needs_download, start = _download_start(cached, today)
+        if needs_download:
+            pending[symbol] = (symbol_key, cached, mtime, migrate, start)
         else:
-            updated = cached
+            loaded[symbol] = _store_symbol_data(symbol_key, cached, None, mtime, migrate)
 
-    updated = updated.sort_index()
-    updated.to_csv(cache_path)
-    _symbol_cache[symbol_key] = updated
-    return updated
+    if pending:
+        import yfinance as yf
+
+        kwargs: dict[str, object] = {
+            "progress": False, "auto_adjust": False, "group_by": "ticker", "threads": True,
+        }
+        starts = [entry[4] for entry in pending.values()]
+        if any(start is None for start in starts):
+            kwargs["period"] = "max"
+        else:
+            kwargs["start"] = min(starts)
+        raw = yf.download(list(pending), **kwargs)
+        multi = isinstance(raw.columns, pd.MultiIndex)
+        tickers = raw.columns.get_level_values(0) if multi else pd.Index([])
+        for symbol, (symbol_key, cached, mtime, migrate, _) in pending.items():
+            if symbol in tickers:
+                frame = raw[symbol]
+            elif not multi and len(pending) == 1:
+                # yfinance < 0.2.48 returns flat columns for a single ticker
+                frame = raw
+            else:
+                frame = pd.DataFrame()
+            downloaded = _normalize_df(frame)
+            loaded[symbol] = _store_symbol_data(symbol_key, cached, downloaded, mtime, migrate)
+    return loaded
 
 
 def synthesize_basket(symbols: Iterable[str]) -> pd.DataFrame:
-    data_frames = [load_symbol_data(symbol) for symbol in symbols]
-    if not data_frames:
+    symbols = list(symbols)
+    if not symbols:
         return pd.DataFrame()
+    loaded = load_many_symbols(symbols)
+    data_frames = [loaded[symbol] for symbol in symbols]
+
+    basket_key = tuple(symbols)
+    sources = tuple(data_frames)
+    basket = _lru_get(_basket_cache, basket_key, sources)
+    if basket is None:
+        basket = _synthesize_from_frames(data_frames)
+        _lru_put(_basket_cache, basket_key, sources, basket, BASKET_CACHE_SIZE)
+    return basket
 
+
+def _synthesize_from_frames(data_frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Equal-weight basket from per-symbol OHLC frames, rebased to 100."""
     common_index = data_frames[0].index
     for df in data_frames[1:]:
         common_index = common_index.intersection(df.index)
@@ -270,47 +577,36 @@ def synthesize_basket(symbols: Iterable[str]) -> pd.DataFrame:
     if common_index.empty:
         return pd.DataFrame()
 
-    aligned = [df.loc[common_index] for df in data_frames]
-    ratio_frames = []
-    for df in aligned:
-        prev_close = df["Close"].shift(1)
-        ratio_frames.append(
-            pd.DataFrame(
-                {
-                    "Open": df["Open"] / prev_close,
-                    "High": df["High"] / prev_close,
-                    "Low": df["Low"] / prev_close,
-                    "Close": df["Close"] / prev_close,
-                }
-            )
-        )
-
-    avg_ratios = pd.concat(ratio_frames).groupby(level=0).mean()
-    avg_ratios = avg_ratios.dropna()
-    if avg_ratios.empty:
+    # Every frame is aligned on common_index, so the per-day average ratio is
+    # an elementwise mean over a (n_symbols, n_days - 1, 4) array of ratios
+    # to the previous day's close, filled in place one symbol at a time.  The
+    # first day has no previous close and is left out.
+    columns = ["Open", "High", "Low", "Close"]
+    ratios = np.empty((len(data_frames), len(common_index) - 1, 4), dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for i, df in enumerate(data_frames):
+            # Symbols usually share every trading day; skip the label
+            # reindex when a frame already sits on the common index
+            aligned = df[columns] if df.index.equals(common_index) else df.loc[common_index, columns]
+            ohlc = aligned.to_numpy(dtype=np.float64)
+            np.divide(ohlc[1:], ohlc[:-1, 3:4], out=ratios[i])
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)  # days where every ratio is 0/0
+        avg_np = np.nanmean(ratios, axis=0)
+    # Drop days without any ratio on the array rather than via a DataFrame
+    keep = ~np.isnan(avg_np).any(axis=1)
+    if not keep.any():
         return pd.DataFrame()
+    ratios = avg_np if keep.all() else avg_np[keep]
+    dates = common_index[1:] if keep.all() else common_index[1:][keep]
 
-    open_series = pd.Series(index=avg_ratios.index, dtype=float)
-    high_series = pd.Series(index=avg_ratios.index, dtype=float)
-    low_series = pd.Series(index=avg_ratios.index, dtype=float)
-    close_series = pd.Series(index=avg_ratios.index, dtype=float)
-
-    prev_close = 100.0
-    for idx, row in avg_ratios.iterrows():
-        open_series[idx] = prev_close * row["Open"]
-        high_series[idx] = prev_close * row["High"]
-        low_series[idx] = prev_close * row["Low"]
-        close_series[idx] = prev_close * row["Close"]
-        prev_close = close_series[idx]
-
-    return pd.DataFrame(
-        {
-            "Open": open_series,
-            "High": high_series,
-            "Low": low_series,
-            "Close": close_series,
-        }
-    )
+    # Rebuild prices from the averaged ratios starting at 100.  The previous
+    # close for each day is a running product seeded with 100 (accumulated
+    # left to right, matching day-by-day compounding); every OHLC column is
+    # its ratio times that previous close.
+    scale = np.empty(len(ratios))
+    np.multiply.accumulate(np.r_[100.0, ratios[:-1, 3]], out=scale)
+    return pd.DataFrame(ratios * scale[:, None], index=dates, columns=columns)
 
 
 # =============================================================================
@@ -366,6 +662,8 @@ def get_market_caps(symbols: list[str]) -> dict[str, float]:
 
         # Fetch from yfinance
         try:
+            import yfinance as yf
+
             info = yf.Ticker(sym).info
             mcap = float(info.get("marketCap", 0) or 0)
         except Exception:
@@ -402,6 +700,56 @@ def prev_trading_day(index: pd.DatetimeIndex, date: pd.Timestamp) -> pd.Timestam
     return index[pos]
 
 
+# "Jan-1" style labels for every (month, day), indexed by month * 32 + day
+_DAY_LABEL_TABLE = np.array(
+    [
+        f"{MONTH_NAMES[m - 1]}-{d}" if m and d else ""
+        for m in range(13)
+        for d in range(32)
+    ],
+    dtype=object,
+)
+
+# Label of every day of year 1-366 in the non-leap reference year 2023
+# (day 366 rolls over to "Jan-1"), indexed by day of year
+_DOY_LABEL_TABLE = np.array(
+    [""] + [
+        f"{MONTH_NAMES[d.month - 1]}-{d.day}"
+        for d in (dt.date(2023, 1, 1) + dt.timedelta(days=i) for i in range(366))
+    ],
+    dtype=object,
+)
+
+
+def _day_labels(index: pd.DatetimeIndex) -> list[str]:
+    """'Mon-D' label of every date in the index, via one table gather."""
+    return _DAY_LABEL_TABLE[index.month.to_numpy() * 32 + index.day.to_numpy()].tolist()
+
+
+def trading_range_positions(
+    index_values: np.ndarray, ranges: list[tuple]
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    [start, stop) positions in a sorted datetime64 index of the trading days
+    inside each inclusive (entry, exit) date range, found with one batched
+    searchsorted per side. A range with no trading days has start >= stop.
+    """
+    bounds = np.array(ranges, dtype=index_values.dtype).reshape(-1, 2)
+    starts = np.searchsorted(index_values, bounds[:, 0], side="left")
+    stops = np.searchsorted(index_values, bounds[:, 1], side="right")
+    return starts, stops
+
+
+def _positions_mask(n: int, starts: np.ndarray, stops: np.ndarray) -> np.ndarray:
+    """Boolean mask of length n covering the union of [start, stop) spans."""
+    delta = np.zeros(n + 1, dtype=np.int64)
+    nonempty = starts < stops
+    np.add.at(delta, starts[nonempty], 1)
+    np.add.at(delta, stops[nonempty], -1)
+    return np.cumsum(delta[:-1]) > 0
+
+
+@functools.lru_cache(maxsize=64)
 def get_first_monday(year: int) -> pd.Timestamp:
     """Get the first Monday of a given year."""
     jan1 = pd.Timestamp(year=year, month=1, day=1)
@@ -415,16 +763,104 @@ def compute_window_return(
     df: pd.DataFrame, start: pd.Timestamp, end: pd.Timestamp
 ) -> float | None:
     """Compute net return % for a window using closing prices."""
-    window = df.loc[start:end]
-    if window.empty or len(window) < 1:
+    # Resolve the same rows df.loc[start:end] would select as positions and
+    # read the two closes from the column array, without building the slice.
+    window = df.index.slice_indexer(start, end)
+    first, stop, _ = window.indices(len(df))
+    if first >= stop:
         return None
-    start_close = float(window.iloc[0]["Close"])
-    end_close = float(window.iloc[-1]["Close"])
+    close = df["Close"].to_numpy()
+    start_close = float(close[first])
+    end_close = float(close[stop - 1])
     if start_close == 0:
         return None
     return (end_close / start_close - 1) * 100
 
 
+@functools.lru_cache(maxsize=64)
+def _year_week_starts(year: int) -> np.ndarray:
+    """The 52 Mondays starting at the first Monday of ``year`` (datetime64[D])."""
+    jan1 = dt.date(year, 1, 1)
+    first_monday = np.datetime64(jan1, "D") + (7 - jan1.weekday()) % 7
+    week_starts = first_monday + np.arange(52) * 7
+    week_starts.setflags(write=False)
+    return week_starts
+
+
+@functools.lru_cache(maxsize=64)
+def _year_month_bounds(year: int) -> tuple[np.ndarray, np.ndarray]:
+    """First and last day of each month of ``year`` (datetime64[D])."""
+    months = np.arange(f"{year}-01", f"{year + 1}-01", dtype="datetime64[M]")
+    month_starts = months.astype("datetime64[D]")
+    month_ends = (months + 1).astype("datetime64[D]") - 1
+    month_starts.setflags(write=False)
+    month_ends.setflags(write=False)
+    return month_starts, month_ends
+
+
+@functools.lru_cache(maxsize=16)
+def _weekly_base_bounds(years: tuple[int, ...]) -> np.ndarray:
+    """Un-offset week start dates, shape (53, len(years)), read-only."""
+    starts = np.empty((53, len(years)), dtype="datetime64[D]")
+    for col, year in enumerate(years):
+        starts[:52, col] = _year_week_starts(year)
+        starts[52, col] = _year_week_starts(year + 1)[0]
+    starts.setflags(write=False)
+    return starts
+
+
+@functools.lru_cache(maxsize=16)
+def _monthly_base_bounds(years: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """Un-offset month (start, end) dates, shape (24, len(years)), read-only."""
+    starts = np.empty((24, len(years)), dtype="datetime64[D]")
+    ends = np.empty_like(starts)
+    for col, year in enumerate(years):
+        starts[:12, col], ends[:12, col] = _year_month_bounds(year)
+        starts[12:, col], ends[12:, col] = _year_month_bounds(year + 1)
+    starts.setflags(write=False)
+    ends.setflags(write=False)
+    return starts, ends
+
+
+def _weekly_window_bounds(
+    years: list[int], offset_days: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Offset-adjusted (start, end) dates for every (week, year) cell.
+
+    Weeks are aligned to the first Monday of each year. Row 52 is the
+    wraparound week: week 1 of the following year. Returns two
+    datetime64 arrays of shape (53, len(years)).
+    """
+    # The grid only depends on the years; offset sweeps just shift it
+    starts = _weekly_base_bounds(tuple(years)) + offset_days
+    ends = starts + 6
+    return starts, ends
+
+
+def _monthly_window_bounds(
+    years: list[int], offset_days: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Offset-adjusted (start, end) dates for every (month, year) cell.
+
+    Rows 0-11 are Jan-Dec of the year itself, rows 12-23 the rollover
+    months taken from the following year. Returns two datetime64 arrays
+    of shape (24, len(years)).
+    """
+    starts, ends = _monthly_base_bounds(tuple(years))
+    return starts + offset_days, ends + offset_days
+
+
+def _last_year(index: pd.DatetimeIndex) -> int:
+    """Calendar year of the latest bar in a date index."""
+    # Loaded histories are sorted, and pandas caches the monotonic check on
+    # the index, so repeat calls on the same data skip the full scan.
+    if index.is_monotonic_increasing:
+        return index[-1].year
+    return index.max().year
+
+
 def generate_seasonal_data(
     df: pd.DataFrame, period: str, offset_days: int, num_years: int
 ) -> list[SeasonalRow]:
@@ -433,74 +869,50 @@ def generate_seasonal_data(
         return []
 
     index = df.index
-    last_date = index.max().normalize()
-    current_year = last_date.year
+    current_year = _last_year(index)
     years = list(range(current_year - num_years + 1, current_year + 1))
 
     if period == "weekly":
         # 52 weeks + 1 wraparound week, aligned to first Monday of each year
-        rows: list[SeasonalRow] = []
-        for week_num in range(1, 54):  # 53 weeks (52 + 1 wraparound)
-            # Wraparound: week 53 uses week 1 of next year's pattern
-            is_wraparound = week_num == 53
-            label = f"Week {week_num}" if not is_wraparound else "Week 1+"
-            row = SeasonalRow(label=label)
-            
-            for year in years:
-                if is_wraparound:
-                    # Use week 1 data but from the following year
-                    data_year = year + 1
-                    actual_week = 1
-                else:
-                    data_year = year
-                    actual_week = week_num
-                
-                first_monday = get_first_monday(data_year)
-                week_start = first_monday + pd.Timedelta(days=7 * (actual_week - 1))
-                week_end = week_start + pd.Timedelta(days=6)
-                # Apply offset
-                adj_start = week_start + pd.Timedelta(days=offset_days)
-                adj_end = week_end + pd.Timedelta(days=offset_days)
-                # Find actual trading days
-                start = next_trading_day(index, adj_start)
-                end = prev_trading_day(index, adj_end)
-                if start is None or end is None or start > end:
-                    row.year_returns[year] = None
-                else:
-                    row.year_returns[year] = compute_window_return(df, start, end)
-            rows.append(row)
-        return rows
+        labels = [f"Week {week_num}" for week_num in range(1, 53)] + ["Week 1+"]
+        adj_starts, adj_ends = _weekly_window_bounds(years, offset_days)
     else:
         # 24 months (12 months + 12 months rollover into next year)
-        rows = []
-        for month_num in range(1, 25):  # 24 months
-            is_rollover = month_num > 12
-            actual_month = month_num if month_num <= 12 else month_num - 12
-            
-            if is_rollover:
-                label = f"{MONTH_NAMES[actual_month - 1]}+"
-            else:
-                label = MONTH_NAMES[actual_month - 1]
-            row = SeasonalRow(label=label)
-            
-            for year in years:
-                # For rollover months, use next year's data
-                data_year = year + 1 if is_rollover else year
-                
-                month_start = pd.Timestamp(year=data_year, month=actual_month, day=1)
-                month_end = (month_start + pd.offsets.MonthEnd(0)).normalize()
-                # Apply offset
-                adj_start = month_start + pd.Timedelta(days=offset_days)
-                adj_end = month_end + pd.Timedelta(days=offset_days)
-                # Find actual trading days
-                start = next_trading_day(index, adj_start)
-                end = prev_trading_day(index, adj_end)
-                if start is None or end is None or start > end:
-                    row.year_returns[year] = None
-                else:
-                    row.year_returns[year] = compute_window_return(df, start, end)
-            rows.append(row)
-        return rows
+        labels = MONTH_NAMES + [f"{name}+" for name in MONTH_NAMES]
+        adj_starts, adj_ends = _monthly_window_bounds(years, offset_days)
+
+    # Find actual trading days for all windows in one batched search:
+    # first trading day on/after the start, last one on/before the end.
+    # Search raw int64 ticks in the index's own unit: no DatetimeIndex
+    # boxing of the bounds and no unit conversion of the whole index.
+    # The grids are flattened year by year, so the queries ascend (almost)
+    # monotonically and searchsorted's binary search reuses its last result.
+    index_i8 = index.asi8
+    tick = f"datetime64[{index.unit}]"
+    start_pos = np.searchsorted(index_i8, adj_starts.T.ravel().astype(tick).view(np.int64), side="left")
+    end_pos = np.searchsorted(index_i8, adj_ends.T.ravel().astype(tick).view(np.int64), side="right") - 1
+    valid = (start_pos < len(index)) & (end_pos >= 0) & (start_pos <= end_pos)
+
+    # Close-to-close return of every window in one gather (same as
+    # compute_window_return); invalid cells gather position 0 and are masked.
+    close_arr = df["Close"].to_numpy(dtype=np.float64)
+    start_close = close_arr[np.where(valid, start_pos, 0)]
+    end_close = close_arr[np.where(valid, end_pos, 0)]
+    valid &= start_close != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.where(valid, (end_close / start_close - 1) * 100, np.nan)
+    returns = np.ascontiguousarray(returns.reshape(len(years), len(labels)).T)
+    # Rows (and their memoized copies in _rows_cache) share this matrix
+    returns.setflags(write=False)
+
+    # Each row holds a view into its slice of the returns matrix and shares
+    # one years tuple, so no per-row dict is built.
+    years_tuple = tuple(years)
+    stats = _seasonal_row_stats(returns)
+    return [
+        SeasonalRow(label=label, years=years_tuple, returns=returns[i], _stats=stats[i])
+        for i, label in enumerate(labels)
+    ]
 
 
 # =============================================================================
@@ -516,69 +928,35 @@ def detect_runs(rows: list[SeasonalRow], min_length: int = 2, threshold_pct: flo
     """
     if not rows:
         return []
-    
-    runs: list[RunInfo] = []
-    current_start = 0
-    current_bullish: bool | None = None
-    current_sum = 0.0
-    
-    for i, row in enumerate(rows):
-        ev = row.expected_value
-        trend = row.trend_pct
-        
-        # Check if this row is neutral (None EV or trend% below threshold)
-        is_neutral = ev is None or trend is None or trend[0] < threshold_pct
-        
-        if is_neutral:
-            # End current run if any
-            if current_bullish is not None and (i - current_start) >= min_length:
-                runs.append(RunInfo(
-                    start_idx=current_start,
-                    end_idx=i - 1,
-                    is_bullish=current_bullish,
-                    ev_sum=current_sum,
-                ))
-            current_bullish = None
-            current_sum = 0.0
-            current_start = i + 1
-            continue
-        
-        # At this point, ev is guaranteed to be not None
-        assert ev is not None
-        is_bullish = ev >= 0
-        
-        if current_bullish is None:
-            # Start new run
-            current_bullish = is_bullish
-            current_start = i
-            current_sum = ev
-        elif is_bullish == current_bullish:
-            # Continue run
-            current_sum += ev
-        else:
-            # Direction changed - end current run if long enough
-            if (i - current_start) >= min_length:
-                runs.append(RunInfo(
-                    start_idx=current_start,
-                    end_idx=i - 1,
-                    is_bullish=current_bullish,
-                    ev_sum=current_sum,
-                ))
-            # Start new run
-            current_bullish = is_bullish
-            current_start = i
-            current_sum = ev
-    
-    # Handle final run
-    if current_bullish is not None and (len(rows) - current_start) >= min_length:
-        runs.append(RunInfo(
-            start_idx=current_start,
-            end_idx=len(rows) - 1,
-            is_bullish=current_bullish,
-            ev_sum=current_sum,
-        ))
-    
-    return runs
+
+    _, trend, _, ev = _row_stat_arrays(rows)
+
+    if _nb is not None:
+        starts, ends, bulls, ev_sums = _nb.detect_runs(ev, trend, float(threshold_pct), min_length)
+        return [
+            RunInfo(start_idx=start, end_idx=end, is_bullish=bull, ev_sum=ev_sum)
+            for start, end, bull, ev_sum in zip(
+                starts.tolist(), ends.tolist(), bulls.tolist(), ev_sums.tolist()
+            )
+        ]
+
+    # Direction per period: +1 bullish, -1 bearish, 0 neutral (None EV or
+    # trend% below threshold).  Runs are the maximal stretches of equal
+    # direction, found by run-length encoding.
+    neutral = np.isnan(ev) | (trend < threshold_pct)
+    direction = np.where(neutral, 0, np.where(ev >= 0, 1, -1))
+    starts = np.flatnonzero(np.diff(direction, prepend=direction[0] - 1) != 0)
+    ends = np.r_[starts[1:], len(direction)] - 1
+    dirs = direction[starts]
+    ev_sums = np.add.reduceat(np.nan_to_num(ev), starts)
+
+    keep = (dirs != 0) & (ends - starts + 1 >= min_length)
+    return [
+        RunInfo(start_idx=start, end_idx=end, is_bullish=d > 0, ev_sum=ev_sum)
+        for start, end, d, ev_sum in zip(
+            starts[keep].tolist(), ends[keep].tolist(), dirs[keep].tolist(), ev_sums[keep].tolist()
+        )
+    ]
 
 
 def build_run_map(runs: list[RunInfo]) -> tuple[dict[int, float], dict[int, bool]]:
@@ -588,14 +966,10 @@ def build_run_map(runs: list[RunInfo]) -> tuple[dict[int, float], dict[int, bool
         - run_ev_at_end: dict mapping end_idx -> ev_sum (only at end of run)
         - run_membership: dict mapping row_idx -> is_bullish (for all rows in runs)
     """
-    run_ev_at_end: dict[int, float] = {}
+    run_ev_at_end = {run.end_idx: run.ev_sum for run in runs}
     run_membership: dict[int, bool] = {}
-    
     for run in runs:
-        run_ev_at_end[run.end_idx] = run.ev_sum
-        for i in range(run.start_idx, run.end_idx + 1):
-            run_membership[i] = run.is_bullish
-    
+        run_membership.update(dict.fromkeys(range(run.start_idx, run.end_idx + 1), run.is_bullish))
     return run_ev_at_end, run_membership
 
 
@@ -610,54 +984,33 @@ def get_period_days(period: str, period_type: str) -> int:
     else:
         # Monthly - use average days per month
         # Handle wraparound labels like "Jan+"
-        month_key = period.rstrip("+")
-        month_days = {
-            "Jan": 31, "Feb": 28, "Mar": 31, "Apr": 30,
-            "May": 31, "Jun": 30, "Jul": 31, "Aug": 31,
-            "Sep": 30, "Oct": 31, "Nov": 30, "Dec": 31,
-        }
-        return month_days.get(month_key, 30)
+        return _MONTH_LABEL_DAYS.get(period.rstrip("+"), 30)
 
 
-def get_period_date_label(period: str, period_type: str, offset_days: int, is_entry: bool) -> str:
+@functools.lru_cache(maxsize=1024)
+def period_month_day(period: str, period_type: str, offset_days: int, is_entry: bool) -> tuple[int, int]:
     """
-    Convert a period label to a date string like 'Jan-15'.
+    (month, day) a period label maps to, month 1-based.
     For entry: start of period + offset
     For exit: end of period + offset
     """
-    month_abbrs = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", 
-                   "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-    
     if period_type == "monthly":
-        # Handle wraparound labels like "Jan+"
-        month_key = period.rstrip("+")
-        month_num = {
-            "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4,
-            "May": 5, "Jun": 6, "Jul": 7, "Aug": 8,
-            "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
-        }.get(month_key, 1)
-        
-        month_days = {
-            1: 31, 2: 28, 3: 31, 4: 30,
-            5: 31, 6: 30, 7: 31, 8: 31,
-            9: 30, 10: 31, 11: 30, 12: 31,
-        }
+        # Handle wraparound labels like "Jan+"; month_idx is 0-based
+        month_idx = _MONTH_IDX.get(period.rstrip("+"), 0)
         
         if is_entry:
             # Entry: 1st of month + offset
             day = 1 + offset_days
-            current_month = month_num
         else:
             # Exit: last day of month + offset
-            day = month_days[month_num] + offset_days
-            current_month = month_num
+            day = _MONTH_DAYS[month_idx] + offset_days
         
         # Handle day overflow into next month
-        while day > month_days[current_month]:
-            day -= month_days[current_month]
-            current_month = (current_month % 12) + 1
+        while day > _MONTH_DAYS[month_idx]:
+            day -= _MONTH_DAYS[month_idx]
+            month_idx = (month_idx + 1) % 12
         
-        return f"{month_abbrs[current_month - 1]}-{day}"
+        return month_idx + 1, day
     else:
         # Weekly - calculate actual calendar date
         # Parse week number from "Week X" or "Week X+"
@@ -668,28 +1021,89 @@ def get_period_date_label(period: str, period_type: str, offset_days: int, is_en
         # First Monday of a typical year (e.g., 2024 starts on Monday Jan 1)
         # But we use a generic calculation based on first Monday of year
         reference_year = 2024  # Using 2024 as reference (Jan 1 is Monday)
-        first_monday = get_first_monday(reference_year)
+        first_monday = get_first_monday(reference_year).date()
         
-        # Calculate the Monday of the target week
-        week_start = first_monday + pd.Timedelta(days=7 * (week_num - 1))
+        # Calculate the Monday of the target week (plain date arithmetic,
+        # no pandas Timedelta objects)
+        week_start = first_monday + dt.timedelta(days=7 * (week_num - 1))
         
         if is_entry:
             # Entry: Monday of the week + offset
-            target_date = week_start + pd.Timedelta(days=offset_days)
+            target_date = week_start + dt.timedelta(days=offset_days)
         else:
             # Exit: Sunday of the week (Monday + 6) + offset
-            target_date = week_start + pd.Timedelta(days=6 + offset_days)
+            target_date = week_start + dt.timedelta(days=6 + offset_days)
         
-        # Format as "Mon-DD" (e.g., "Jan-29", "Feb-5")
-        return f"{month_abbrs[target_date.month - 1]}-{target_date.day}"
+        return target_date.month, target_date.day
+
+
+def get_period_date_label(period: str, period_type: str, offset_days: int, is_entry: bool) -> str:
+    """
+    Convert a period label to a date string like 'Jan-15' (see period_month_day).
+    """
+    month, day = period_month_day(period, period_type, offset_days, is_entry)
+    return f"{MONTH_NAMES[month - 1]}-{day}"
 
 
 def calculate_run_days(rows: list[SeasonalRow], start_idx: int, end_idx: int, period_type: str) -> int:
     """Calculate total calendar days for a run."""
-    total_days = 0
-    for i in range(start_idx, end_idx + 1):
-        total_days += get_period_days(rows[i].label, period_type)
-    return total_days
+    if period_type == "weekly":
+        return 7 * (end_idx - start_idx + 1)
+    # Monthly: look each row's label up directly rather than calling
+    # get_period_days (and stripping the "+" suffix) per row
+    return sum(_MONTH_LABEL_DAYS.get(row.label, 30) for row in rows[start_idx:end_idx + 1])
+
+
+def _returns_matrix(rows: list[SeasonalRow], years: list[int]) -> np.ndarray:
+    """(len(rows), len(years)) matrix of per-year returns %, NaN where missing."""
+    if rows and all(row.years == rows[0].years for row in rows):
+        # Rows from generate_seasonal_data share one years axis.  Callers
+        # usually ask for a contiguous run of it (all years but the current
+        # one), which is a plain column slice of the stacked rows; otherwise
+        # gather the requested columns, routing unknown years to a trailing
+        # NaN column.
+        col_of = {year: i for i, year in enumerate(rows[0].years)}
+        cols = [col_of.get(year, -1) for year in years]
+        if cols and cols[0] >= 0 and cols == list(range(cols[0], cols[0] + len(cols))):
+            return np.stack([row.returns[cols[0]:cols[-1] + 1] for row in rows])
+        padded = np.full((len(rows), len(rows[0].years) + 1), np.nan)
+        padded[:, :-1] = np.stack([row.returns for row in rows])
+        return padded[:, cols]
+    matrix = np.full((len(rows), len(years)), np.nan)
+    for i, row in enumerate(rows):
+        for j, year in enumerate(years):
+            ret = row.get_year_return(year)
+            if ret is not None:
+                matrix[i, j] = ret
+    return matrix
+
+
+def _compound_runs(
+    returns: np.ndarray, starts: np.ndarray, ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compounded growth of each run (rows starts[k]..ends[k]) in every year of
+    a (n_periods, n_years) returns % matrix; periods without data count as
+    flat. Returns (growth, traded, buy_hold) where traded marks run/year
+    cells with any data and buy_hold is the growth over all periods.
+    """
+    if _nb is not None:
+        return _nb.compound_runs(np.ascontiguousarray(returns, dtype=np.float64), starts, ends)
+    growth = returns / 100 + 1
+    has_data = ~np.isnan(growth)
+    growth = np.where(has_data, growth, 1.0)
+    buy_hold = np.prod(growth, axis=0)
+    if len(starts) == 0:
+        n_years = returns.shape[1]
+        return np.ones((0, n_years)), np.zeros((0, n_years), dtype=bool), buy_hold
+    # One reduceat over [start, end + 1) pairs; the odd (between-run)
+    # segments are discarded. A trailing flat row keeps end + 1 in bounds.
+    bounds = np.column_stack((starts, ends + 1)).ravel()
+    growth = np.vstack((growth, np.ones((1, growth.shape[1]))))
+    has_data = np.vstack((has_data, np.zeros((1, has_data.shape[1]), dtype=bool)))
+    run_growth = np.multiply.reduceat(growth, bounds, axis=0)[::2]
+    run_traded = np.logical_or.reduceat(has_data, bounds, axis=0)[::2]
+    return run_growth, run_traded, buy_hold
 
 
 def simulate_trades_for_year(
@@ -702,61 +1116,7 @@ def simulate_trades_for_year(
     Simulate trades for a specific year based on green runs.
     Buy at start of green run, sell at end. Compound profits across runs.
     """
-    trades: list[Trade] = []
-    compounded_value = 1.0  # Start with 1 unit
-    total_days = 0
-    
-    for run_idx, run in enumerate(runs):
-        if not run.is_bullish:
-            continue  # Only trade green runs
-        
-        # Calculate compounded return for this run in this specific year
-        run_return = 1.0
-        periods_with_data = 0
-        for i in range(run.start_idx, run.end_idx + 1):
-            row = rows[i]
-            year_ret = row.year_returns.get(year)
-            if year_ret is not None:
-                run_return *= (1 + year_ret / 100)
-                periods_with_data += 1
-        
-        if periods_with_data == 0:
-            continue
-        
-        profit_pct = (run_return - 1) * 100
-        periods_held = run.end_idx - run.start_idx + 1
-        days_held = calculate_run_days(rows, run.start_idx, run.end_idx, period_type)
-        
-        trade = Trade(
-            run_idx=run_idx,
-            entry_period=rows[run.start_idx].label,
-            exit_period=rows[run.end_idx].label,
-            periods_held=periods_held,
-            days_held=days_held,
-            profit_pct=profit_pct,
-        )
-        trades.append(trade)
-        
-        compounded_value *= run_return
-        total_days += days_held
-    
-    total_profit_pct = (compounded_value - 1) * 100
-    
-    # Calculate buy and hold for whole year (first to last period)
-    buy_hold_return = 1.0
-    for row in rows:
-        year_ret = row.year_returns.get(year)
-        if year_ret is not None:
-            buy_hold_return *= (1 + year_ret / 100)
-    buy_hold_profit_pct = (buy_hold_return - 1) * 100
-    
-    return YearlyTradeResult(
-        year=year,
-        trades=trades,
-        total_profit_pct=total_profit_pct,
-        total_days_held=total_days,
-        buy_hold_profit_pct=buy_hold_profit_pct,
-    )
+    return simulate_all_years(rows, runs, [year], period_type)[year]
 
 
 def simulate_all_years(
@@ -765,11 +1125,61 @@ def simulate_all_years(
     years: list[int],
     period_type: str,
 ) -> dict[int, YearlyTradeResult]:
-    """Simulate trades for all years."""
-    results: dict[int, YearlyTradeResult] = {}
-    for year in years:
-        results[year] = simulate_trades_for_year(rows, runs, year, period_type)
-    return results
+    """
+    Simulate trades for all years.
+    Each run's compounded return is computed for every year at once from a
+    (n_periods, n_years) growth matrix; periods without data count as flat.
+    """
+    green = [(run_idx, run) for run_idx, run in enumerate(runs) if run.is_bullish]  # Only trade green runs
+    starts = np.array([run.start_idx for _, run in green], dtype=np.int64)
+    ends = np.array([run.end_idx for _, run in green], dtype=np.int64)
+    run_growth, run_traded, buy_hold = _compound_runs(_returns_matrix(rows, years), starts, ends)
+
+    trades: dict[int, list[Trade]] = {year: [] for year in years}
+    compounded_value = np.ones(len(years))  # Start with 1 unit
+    total_days = np.zeros(len(years), dtype=np.int64)
+
+    for (run_idx, run), run_return, traded in zip(green, run_growth, run_traded):
+        # Years with no data in any of the run's periods get no trade
+        if not traded.any():
+            continue
+
+        periods_held = run.end_idx - run.start_idx + 1
+        days_held = calculate_run_days(rows, run.start_idx, run.end_idx, period_type)
+        entry_period = rows[run.start_idx].label
+        exit_period = rows[run.end_idx].label
+        for year, ret, was_traded in zip(years, run_return.tolist(), traded.tolist()):
+            if was_traded:
+                trades[year].append(Trade(
+                    run_idx=run_idx,
+                    entry_period=entry_period,
+                    exit_period=exit_period,
+                    periods_held=periods_held,
+                    days_held=days_held,
+                    profit_pct=(ret - 1) * 100,
+                ))
+
+        compounded_value *= np.where(traded, run_return, 1.0)
+        total_days += np.where(traded, days_held, 0)
+
+    total_profit_pct = (compounded_value - 1) * 100
+
+    # Buy and hold for whole year (first to last period)
+    buy_hold_profit_pct = (buy_hold - 1) * 100
+
+    return {
+        year: YearlyTradeResult(
+            year=year,
+            trades=trades[year],
+            total_profit_pct=total_profit,
+            total_days_held=days,
+            buy_hold_profit_pct=buy_hold,
+            trades_by_key={(t.entry_period, t.exit_period): t for t in trades[year]},
+        )
+        for year, total_profit, days, buy_hold in zip(
+            years, total_profit_pct.tolist(), total_days.tolist(), buy_hold_profit_pct.tolist()
+        )
+    }
 
 
 # =============================================================================
@@ -792,14 +1202,12 @@ class SlidingWindow:
     def start_date_str(self) -> str:
         """Convert start_day to 'Mon-DD' format."""
         # Use a non-leap year as reference
-        ref_date = dt.date(2023, 1, 1) + dt.timedelta(days=self.start_day - 1)
-        return f"{calendar.month_abbr[ref_date.month]}-{ref_date.day}"
+        return _DOY_LABEL_TABLE[self.start_day]
     
     @property
     def end_date_str(self) -> str:
         """Convert end_day to 'Mon-DD' format."""
-        ref_date = dt.date(2023, 1, 1) + dt.timedelta(days=self.end_day - 1)
-        return f"{calendar.month_abbr[ref_date.month]}-{ref_date.day}"
+        return _DOY_LABEL_TABLE[self.end_day]
 
 
 def day_of_year(month: int, day: int) -> int:
@@ -1357,13 +1765,47 @@ def get_years_from_data(df: pd.DataFrame) -> list[int]:
     """Get the list of analysis years from data, excluding current year."""
     if df.empty:
         return []
-    last_date = df.index.max().normalize()
-    current_year = last_date.year
+    current_year = _last_year(df.index)
     all_years = list(range(current_year - NUM_YEARS + 1, current_year + 1))
     # Skip current year (incomplete)
     return [y for y in all_years if y != current_year]
 
 
+def _seasonal_rows(
+    data: pd.DataFrame, symbols: list[str], period: str, offset: int
+) -> list[SeasonalRow]:
+    """
+    Seasonal rows for already-loaded data, memoized per (symbols, period,
+    offset) while ``data`` is the same object. Callers must not mutate the
+    returned list.
+    """
+    key = (tuple(symbols), period, offset)
+    seasonal_rows = _lru_get(_rows_cache, key, (data,))
+    if seasonal_rows is None:
+        seasonal_rows = generate_seasonal_data(data, period, offset, NUM_YEARS)
+        _lru_put(_rows_cache, key, (data,), seasonal_rows, ROWS_CACHE_SIZE)
+    return seasonal_rows
+
+
+def _seasonal_analysis(
+    data: pd.DataFrame, symbols: list[str], period: str, offset: int, threshold: int
+) -> tuple[list[int], list[SeasonalRow], list[RunInfo]]:
+    """
+    Years, seasonal rows and runs for already-loaded data, memoized per
+    (symbols, period, offset, threshold) while ``data`` is the same object.
+    Callers must not mutate the returned rows or runs lists.
+    """
+    key = (tuple(symbols), period, offset, threshold)
+    analysis = _lru_get(_analysis_cache, key, (data,))
+    if analysis is None:
+        years = get_years_from_data(data)
+        seasonal_rows = _seasonal_rows(data, symbols, period, offset)
+        runs = detect_runs(seasonal_rows, min_length=2, threshold_pct=threshold)
+        analysis = (years, seasonal_rows, runs)
+        _lru_put(_analysis_cache, key, (data,), analysis, ANALYSIS_CACHE_SIZE)
+    return analysis
+
+
 def get_stats(
     symbols: list[str],
     period: str,
@@ -1383,12 +1825,12 @@ def get_stats(
     if data.empty:
         return {"error": "No data available", "rows": [], "years": [], "runs": []}
     
-    years = get_years_from_data(data)
-    seasonal_rows = generate_seasonal_data(data, period, offset, NUM_YEARS)
-    runs = detect_runs(seasonal_rows, min_length=2, threshold_pct=threshold)
+    years, seasonal_rows, runs = _seasonal_analysis(data, symbols, period, offset, threshold)
     run_ev_at_end, run_membership = build_run_map(runs)
     
     # Convert to JSON-serializable format
+    year_keys = [str(y) for y in years]
+    year_returns = _returns_matrix(seasonal_rows, years).tolist()
     rows_data = []
     for idx, row in enumerate(seasonal_rows):
         trend = row.trend_pct
@@ -1407,7 +1849,10 @@ def get_stats(
             "in_run": in_run,
             "is_bullish_run": is_bullish_run,
             "avg": row.average,
-            "years": {str(y): row.year_returns.get(y) for y in years},
+            "years": {
+                key: None if math.isnan(ret) else ret
+                for key, ret in zip(year_keys, year_returns[idx])
+            },
         }
         rows_data.append(row_dict)
     
@@ -1428,6 +1873,45 @@ def get_stats(
     }
 
 
+def _traded_runs(runs: list[RunInfo], period: str) -> list[RunInfo]:
+    """
+    Green runs that become trades; for monthly, only runs that START in the
+    first 12 months, to avoid duplicates from the rollover section.
+    """
+    green_runs = [r for r in runs if r.is_bullish]
+    if period == "monthly":
+        green_runs = [r for r in green_runs if r.start_idx < 12]
+    return green_runs
+
+
+def _trade_periods(
+    symbols: list[str],
+    period: str,
+    offset: int,
+    threshold: int,
+) -> list[tuple[str, str]]:
+    """
+    (entry_date, exit_date) labels of the trades get_trades would list,
+    without simulating every year's profits.
+    """
+    if len(symbols) == 1:
+        data = load_symbol_data(symbols[0])
+    else:
+        data = synthesize_basket(symbols)
+    
+    if data.empty:
+        return []
+    
+    _, seasonal_rows, runs = _seasonal_analysis(data, symbols, period, offset, threshold)
+    return [
+        (
+            get_period_date_label(seasonal_rows[run.start_idx].label, period, offset, is_entry=True),
+            get_period_date_label(seasonal_rows[run.end_idx].label, period, offset, is_entry=False),
+        )
+        for run in _traded_runs(runs, period)
+    ]
+
+
 def get_trades(
     symbols: list[str],
     period: str,
@@ -1447,19 +1931,15 @@ def get_trades(
     if data.empty:
         return {"error": "No data available", "trades": [], "summary": {}}
     
-    years = get_years_from_data(data)
-    seasonal_rows = generate_seasonal_data(data, period, offset, NUM_YEARS)
-    runs = detect_runs(seasonal_rows, min_length=2, threshold_pct=threshold)
+    years, seasonal_rows, runs = _seasonal_analysis(data, symbols, period, offset, threshold)
     
-    # Get green runs only - for monthly, only include runs that START in first 12 months
-    # to avoid duplicates from the rollover section
-    green_runs = [r for r in runs if r.is_bullish]
-    if period == "monthly":
-        green_runs = [r for r in green_runs if r.start_idx < 12]
+    green_runs = _traded_runs(runs, period)
     
     # Simulate only the filtered green runs
     yearly_results = simulate_all_years(seasonal_rows, green_runs, years, period)
-    
+    # JSON year keys and results, resolved once rather than per trade
+    keyed_results = [(str(year), yearly_results.get(year)) for year in years]
+
     trades_data = []
     for run in green_runs:
         entry = seasonal_rows[run.start_idx].label
@@ -1472,18 +1952,14 @@ def get_trades(
         year_profits = {}
         total_profit = 0.0
         profit_count = 0
-        for year in years:
-            result = yearly_results.get(year)
-            if result:
-                trade = next((t for t in result.trades if t.entry_period == entry and t.exit_period == exit_label), None)
-                if trade:
-                    year_profits[str(year)] = trade.profit_pct
-                    total_profit += trade.profit_pct
-                    profit_count += 1
-                else:
-                    year_profits[str(year)] = None
+        for year_key, result in keyed_results:
+            trade = result.trades_by_key.get((entry, exit_label)) if result else None
+            if trade:
+                year_profits[year_key] = trade.profit_pct
+                total_profit += trade.profit_pct
+                profit_count += 1
             else:
-                year_profits[str(year)] = None
+                year_profits[year_key] = None
         
         avg_profit = total_profit / profit_count if profit_count > 0 else 0
         annualized = (avg_profit * 365 / days) if days > 0 else 0
@@ -1502,8 +1978,7 @@ def get_trades(
     total_days_list = []
     bh_profits = []
     
-    for year in years:
-        result = yearly_results.get(year)
+    for _, result in keyed_results:
         if result:
             total_profits.append(result.total_profit_pct)
             total_days_list.append(result.total_days_held)
@@ -1515,16 +1990,14 @@ def get_trades(
     avg_bh = sum(bh_profits) / len(bh_profits) if bh_profits else 0
     
     # Per-year totals
-    year_totals = {}
-    year_bh = {}
-    for year in years:
-        result = yearly_results.get(year)
-        if result:
-            year_totals[str(year)] = result.total_profit_pct
-            year_bh[str(year)] = result.buy_hold_profit_pct
-        else:
-            year_totals[str(year)] = None
-            year_bh[str(year)] = None
+    year_totals = {
+        year_key: result.total_profit_pct if result else None
+        for year_key, result in keyed_results
+    }
+    year_bh = {
+        year_key: result.buy_hold_profit_pct if result else None
+        for year_key, result in keyed_results
+    }
     
     summary = {
         "avg_profit": avg_total,
@@ -1582,10 +2055,17 @@ def find_optimal_trades(
     best_secondary = float('-inf')
     
     for offset in offsets:
-        seasonal_rows = generate_seasonal_data(data, period, offset, NUM_YEARS)
+        seasonal_rows = _seasonal_rows(data, symbols, period, offset)
+        # Only green runs are traded, so thresholds that leave the same green
+        # runs score identically; ties keep the earlier candidate anyway.
+        seen_green_runs: set[tuple] = set()
         
         for threshold in thresholds:
             runs = detect_runs(seasonal_rows, min_length=2, threshold_pct=threshold)
+            green_key = tuple((r.start_idx, r.end_idx) for r in runs if r.is_bullish)
+            if green_key in seen_green_runs:
+                continue
+            seen_green_runs.add(green_key)
             yearly_results = simulate_all_years(seasonal_rows, runs, years, period)
             
             # Calculate summary metrics
@@ -1627,6 +2107,11 @@ def find_optimal_trades(
                 best_secondary = secondary
                 best_offset = offset
                 best_threshold = threshold
+            
+            if not green_key:
+                # A higher threshold only turns more periods neutral, so no
+                # later threshold at this offset has any green runs either
+                break
     
     return {
         "offset": best_offset,
@@ -1651,31 +2136,32 @@ def export_stats_csv(
     if data.empty:
         return ""
     
+    # The export has no run columns, so skip run detection
     years = get_years_from_data(data)
-    seasonal_rows = generate_seasonal_data(data, period, offset, NUM_YEARS)
+    seasonal_rows = _seasonal_rows(data, symbols, period, offset)
     
-    # Build CSV
-    import io
-    output = io.StringIO()
-    
-    # Header
-    headers = ["Period", "Trend %", "Direction", "EV", "Avg"]
-    headers.extend([str(y) for y in reversed(years)])
-    output.write(",".join(headers) + "\n")
+    avg, trend, is_bull, ev = _row_stat_arrays(seasonal_rows)
+    export_years = list(reversed(years))
+    returns = _returns_matrix(seasonal_rows, export_years)
     
-    # Rows
-    for row in seasonal_rows:
-        trend = row.trend_pct
-        values = [row.label]
-        values.append(f"{trend[0]:.0f}" if trend else "")
-        values.append("Bull" if trend and trend[1] else "Bear" if trend else "")
-        values.append(f"{row.expected_value:.2f}" if row.expected_value is not None else "")
-        values.append(f"{row.average:.2f}" if row.average is not None else "")
-        for year in reversed(years):
-            val = row.year_returns.get(year)
-            values.append(f"{val:.2f}" if val is not None else "")
-        output.write(",".join(values) + "\n")
+    def fmt(val: float) -> str:
+        return "" if math.isnan(val) else f"{val:.2f}"
     
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(["Period", "Trend %", "Direction", "EV", "Avg"] + [str(y) for y in export_years])
+    writer.writerows(
+        [
+            row.label,
+            "" if math.isnan(t) else f"{t:.0f}",
+            "" if math.isnan(t) else ("Bull" if bull else "Bear"),
+            fmt(e),
+            fmt(a),
+        ] + [fmt(val) for val in year_vals]
+        for row, t, bull, e, a, year_vals in zip(
+            seasonal_rows, trend.tolist(), is_bull.tolist(), ev.tolist(), avg.tolist(), returns.tolist()
+        )
+    )
     return output.getvalue()
 
 
@@ -1691,51 +2177,46 @@ def export_trades_csv(
     if not trades_data.get("trades"):
         return ""
     
-    import io
     output = io.StringIO()
+    writer = csv.writer(output, lineterminator="\n")
     
     years = trades_data["years"]
+    years_desc = [str(y) for y in reversed(years)]
+    
+    def year_cells(by_year: dict) -> list[str]:
+        cells = []
+        for year in years_desc:
+            val = by_year.get(year)
+            cells.append(f"{val:.2f}" if val is not None else "")
+        return cells
     
     # Header
-    headers = ["Entry", "Exit", "Avg Profit %", "Days", "Annualized %"]
-    headers.extend([str(y) for y in reversed(years)])
-    output.write(",".join(headers) + "\n")
+    writer.writerow(["Entry", "Exit", "Avg Profit %", "Days", "Annualized %"] + years_desc)
     
     # Trade rows
-    for trade in trades_data["trades"]:
-        values = [
+    writer.writerows(
+        [
             trade["entry_date"],
             trade["exit_date"],
             f"{trade['avg_profit']:.2f}",
             str(trade["days"]),
             f"{trade['annualized']:.2f}",
-        ]
-        for year in reversed(years):
-            val = trade["years"].get(str(year))
-            values.append(f"{val:.2f}" if val is not None else "")
-        output.write(",".join(values) + "\n")
+        ] + year_cells(trade["years"])
+        for trade in trades_data["trades"]
+    )
     
     # Summary rows
     summary = trades_data["summary"]
-    
-    # TOTAL row
-    values = ["TOTAL", "", f"{summary['avg_profit']:.2f}", str(summary['avg_days']), f"{summary['annualized']:.2f}"]
-    for year in reversed(years):
-        val = summary["year_totals"].get(str(year))
-        values.append(f"{val:.2f}" if val is not None else "")
-    output.write(",".join(values) + "\n")
-    
-    # B&H row
-    values = ["B&H", "", f"{summary['bh_profit']:.2f}", "365", f"{summary['bh_profit']:.2f}"]
-    for year in reversed(years):
-        val = summary["year_bh"].get(str(year))
-        values.append(f"{val:.2f}" if val is not None else "")
-    output.write(",".join(values) + "\n")
-    
-    # EDGE row
-    values = ["EDGE", "vs B&H", "", "", f"{summary['edge']:.2f}"]
-    values.extend(["" for _ in years])
-    output.write(",".join(values) + "\n")
+    writer.writerows([
+        # TOTAL row
+        ["TOTAL", "", f"{summary['avg_profit']:.2f}", str(summary['avg_days']), f"{summary['annualized']:.2f}"]
+        + year_cells(summary["year_totals"]),
+        # B&H row
+        ["B&H", "", f"{summary['bh_profit']:.2f}", "365", f"{summary['bh_profit']:.2f}"]
+        + year_cells(summary["year_bh"]),
+        # EDGE row
+        ["EDGE", "vs B&H", "", "", f"{summary['edge']:.2f}"] + [""] * len(years),
+    ])
     
     return output.getvalue()
 
@@ -1757,12 +2238,12 @@ def export_strategy_csv(
     This format allows concatenating strategies from multiple stocks
     and sorting by date to get a full year trading plan.
     """
-    trades_data = get_trades(symbols, period, offset, threshold)
+    # Only the dates are exported, so skip the per-year trade simulation
+    trade_periods = _trade_periods(symbols, period, offset, threshold)
     
-    if not trades_data.get("trades"):
+    if not trade_periods:
         return ""
     
-    import io
     output = io.StringIO()
     
     # Create display name for the stock(s)
@@ -1774,19 +2255,20 @@ def export_strategy_csv(
         stock_name = "+".join(s.replace(".NS", "") for s in symbols)
     
     # Generate buy/sell entries for each trade
-    for trade in trades_data["trades"]:
-        entry_date = trade["entry_date"]  # e.g., "Jan-15"
-        exit_date = trade["exit_date"]    # e.g., "Feb-28"
-        
-        # Write BUY entry
-        output.write(f"{entry_date},{stock_name},BUY\n")
-        
-        # Write SELL entry
-        output.write(f"{exit_date},{stock_name},SELL\n")
+    # (dates are MMM-DD labels, e.g. "Jan-15" / "Feb-28")
+    writer = csv.writer(output, lineterminator="\n")
+    for entry_date, exit_date in trade_periods:
+        writer.writerow((entry_date, stock_name, "BUY"))
+        writer.writerow((exit_date, stock_name, "SELL"))
     
     return output.getvalue()
 
 
+def _month_day_date(year: int, month: int, day: int) -> dt.date:
+    """Date for (month, day) in year, clamping the day to the month (Feb-29)."""
+    return dt.date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
 def get_backtest_data(
     symbols: list[str],
     period: str,
@@ -1827,7 +2309,8 @@ def get_backtest_data(
     # Filter data for the specified year
     year_start = pd.Timestamp(year=year, month=1, day=1)
     year_end = pd.Timestamp(year=year, month=12, day=31)
-    year_data = data.loc[year_start:year_end].copy()
+    # Read-only slice: only Close and the index are used, so no copy
+    year_data = data.loc[year_start:year_end]
     
     if year_data.empty:
         return {"error": f"No data for year {year}", "seasonal_curve": [], "bh_curve": [], "trades": [], "dates": []}
@@ -1838,56 +2321,32 @@ def get_backtest_data(
         data_warning = f"Incomplete data: only {len(year_data)} trading days (expected ~245)"
     
     # Get seasonal analysis to find green runs
-    seasonal_rows = generate_seasonal_data(data, period, offset, NUM_YEARS)
-    runs = detect_runs(seasonal_rows, min_length=2, threshold_pct=threshold)
-    green_runs = [r for r in runs if r.is_bullish]
+    _, seasonal_rows, runs = _seasonal_analysis(data, symbols, period, offset, threshold)
+    green_runs = _traded_runs(runs, period)
     
-    # For monthly, only include runs that START in first 12 months
-    if period == "monthly":
-        green_runs = [r for r in green_runs if r.start_idx < 12]
-    
-    # Build list of trading periods (entry_date, exit_date) for this year
+    # Build list of trading periods (entry_date, exit_date) for this year.
+    # Dates are kept as (month, day) so the MMM-DD labels never need to be
+    # parsed back.
     trades_info = []
+    trading_periods = []
     for run in green_runs:
         entry_label = seasonal_rows[run.start_idx].label
         exit_label = seasonal_rows[run.end_idx].label
-        entry_date_str = get_period_date_label(entry_label, period, offset, is_entry=True)
-        exit_date_str = get_period_date_label(exit_label, period, offset, is_entry=False)
+        entry_month, entry_day = period_month_day(entry_label, period, offset, is_entry=True)
+        exit_month, exit_day = period_month_day(exit_label, period, offset, is_entry=False)
         days = calculate_run_days(seasonal_rows, run.start_idx, run.end_idx, period)
         trades_info.append({
-            "entry_date": entry_date_str,
-            "exit_date": exit_date_str,
+            "entry_date": f"{MONTH_NAMES[entry_month - 1]}-{entry_day}",
+            "exit_date": f"{MONTH_NAMES[exit_month - 1]}-{exit_day}",
             "days": days,
         })
-    
-    # Convert MMM-DD to actual dates for the year
-    def parse_mmm_dd(mmm_dd: str, ref_year: int) -> pd.Timestamp | None:
-        """Parse 'Jan-15' format to timestamp."""
-        try:
-            month_map = {"Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
-                        "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12}
-            parts = mmm_dd.split("-")
-            month = month_map.get(parts[0], 1)
-            day = int(parts[1])
-            # Clamp day to valid range for month
-            max_day = calendar.monthrange(ref_year, month)[1]
-            day = min(day, max_day)
-            return pd.Timestamp(year=ref_year, month=month, day=day)
-        except (ValueError, IndexError, KeyError):
-            return None
-    
-    # Build trading periods as date ranges
-    trading_periods = []
-    for trade in trades_info:
-        entry = parse_mmm_dd(trade["entry_date"], year)
-        exit_dt = parse_mmm_dd(trade["exit_date"], year)
+        
+        entry = _month_day_date(year, entry_month, entry_day)
+        exit_dt = _month_day_date(year, exit_month, exit_day)
         # Handle wraparound (e.g., entry in Dec, exit in Jan+)
-        if entry and exit_dt:
-            if exit_dt < entry:
-                # Wraparound to next year
-                exit_dt = parse_mmm_dd(trade["exit_date"], year + 1)
-            if entry and exit_dt:
-                trading_periods.append((entry, exit_dt))
+        if exit_dt < entry:
+            exit_dt = _month_day_date(year + 1, exit_month, exit_day)
+        trading_periods.append((entry, exit_dt))
     
     # Vectorized daily returns
     closes = year_data["Close"].values
@@ -1895,27 +2354,20 @@ def get_backtest_data(
     daily_ret[0] = 0.0
     daily_ret[1:] = closes[1:] / closes[:-1] - 1.0
     
-    # Vectorized buy-and-hold curve
-    bh_curve = (np.cumprod(1.0 + daily_ret) - 1.0) * 100.0
+    # Buy-and-hold curve: the compounded daily returns telescope to the
+    # close relative to the first close, so no running product is needed
+    bh_curve = (closes / closes[0] - 1.0) * 100.0
     
     # Build boolean mask for trading periods
     idx_values = year_data.index.values
-    in_market = np.zeros(len(idx_values), dtype=bool)
-    for entry_ts, exit_ts in trading_periods:
-        entry_np = np.datetime64(entry_ts)
-        exit_np = np.datetime64(exit_ts)
-        in_market |= (idx_values >= entry_np) & (idx_values <= exit_np)
+    in_market = _positions_mask(len(idx_values), *trading_range_positions(idx_values, trading_periods))
     
     # Vectorized seasonal curve
     masked_ret = np.where(in_market, daily_ret, 0.0)
     seasonal_curve = (np.cumprod(1.0 + masked_ret) - 1.0) * 100.0
     
     # Vectorized date formatting
-    months = year_data.index.month.values
-    days_arr = year_data.index.day.values
-    month_abbrs = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    dates = [f"{month_abbrs[m]}-{d}" for m, d in zip(months.tolist(), days_arr.tolist())]
+    dates = _day_labels(year_data.index)
     
     result = {
         "seasonal_curve": seasonal_curve.tolist(),
@@ -1951,24 +2403,20 @@ def _apply_entry_stop_loss(
 
     Modifies in_market and daily_ret in place.
     """
-    n_days = len(idx_values)
-
-    for w in windows:
-        start_date = dt.date(year, 1, 1) + dt.timedelta(days=w.start_day - 1)
-        end_date = dt.date(year, 1, 1) + dt.timedelta(days=w.end_day - 1)
-        entry_np = np.datetime64(pd.Timestamp(start_date))
-        exit_np = np.datetime64(pd.Timestamp(end_date))
-        w_mask = (idx_values >= entry_np) & (idx_values <= exit_np)
+    # Each window's trading days are one contiguous [start, stop) span
+    jan1 = dt.date(year, 1, 1)
+    w_starts, w_stops = trading_range_positions(idx_values, [
+        (jan1 + dt.timedelta(days=w.start_day - 1), jan1 + dt.timedelta(days=w.end_day - 1))
+        for w in windows
+    ])
 
+    for w_start, w_stop in zip(w_starts.tolist(), w_stops.tolist()):
         entry_price = np.nan
         stopped_out = False
         reentered = False
         stop_price = 0.0
 
-        for d in range(n_days):
-            if not w_mask[d]:
-                continue
-
+        for d in range(w_start, w_stop):
             close = closes[d]
             if np.isnan(close):
                 continue
@@ -2044,7 +2492,8 @@ def get_window_backtest_data(
     # Filter data for the specified year
     year_start = pd.Timestamp(year=year, month=1, day=1)
     year_end = pd.Timestamp(year=year, month=12, day=31)
-    year_data = df.loc[year_start:year_end].copy()
+    # Read-only slice: only Close and the index are used, so no copy
+    year_data = df.loc[year_start:year_end]
     
     if year_data.empty:
         return {"error": f"No data for year {year}", "seasonal_curve": [], "bh_curve": [], "trades": [], "dates": []}
@@ -2060,8 +2509,8 @@ def get_window_backtest_data(
     for w in windows:
         start_date = dt.date(year, 1, 1) + dt.timedelta(days=w.start_day - 1)
         end_date = dt.date(year, 1, 1) + dt.timedelta(days=w.end_day - 1)
-        entry_str = f"{calendar.month_abbr[start_date.month]}-{start_date.day}"
-        exit_str = f"{calendar.month_abbr[end_date.month]}-{end_date.day}"
+        entry_str = f"{MONTH_NAMES[start_date.month - 1]}-{start_date.day}"
+        exit_str = f"{MONTH_NAMES[end_date.month - 1]}-{end_date.day}"
         trades_info.append({
             "entry_date": entry_str,
             "exit_date": exit_str,
@@ -2078,16 +2527,13 @@ def get_window_backtest_data(
     daily_ret[0] = 0.0
     daily_ret[1:] = closes[1:] / closes[:-1] - 1.0
     
-    # Vectorized buy-and-hold curve
-    bh_curve = (np.cumprod(1.0 + daily_ret) - 1.0) * 100.0
+    # Buy-and-hold curve: the compounded daily returns telescope to the
+    # close relative to the first close, so no running product is needed
+    bh_curve = (closes / closes[0] - 1.0) * 100.0
     
     # Build boolean mask for window periods
     idx_values = year_data.index.values
-    in_market = np.zeros(len(idx_values), dtype=bool)
-    for entry_ts, exit_ts in ts_ranges:
-        entry_np = np.datetime64(entry_ts)
-        exit_np = np.datetime64(exit_ts)
-        in_market |= (idx_values >= entry_np) & (idx_values <= exit_np)
+    in_market = _positions_mask(len(idx_values), *trading_range_positions(idx_values, ts_ranges))
     
     # Apply entry stop-loss per window
     if stop_loss_pct > 0:
@@ -2101,11 +2547,7 @@ def get_window_backtest_data(
     seasonal_curve = (np.cumprod(1.0 + masked_ret) - 1.0) * 100.0
     
     # Vectorized date formatting
-    months = year_data.index.month.values
-    days_arr = year_data.index.day.values
-    month_abbrs = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    dates = [f"{month_abbrs[m]}-{d}" for m, d in zip(months.tolist(), days_arr.tolist())]
+    dates = _day_labels(year_data.index)
     
     result = {
         "seasonal_curve": seasonal_curve.tolist(),
@@ -2169,19 +2611,14 @@ def _build_average_year_series(
     
     # Sort by DOY and compute average return per DOY
     sorted_doys = sorted(doy_returns.keys())
-    avg_rets = np.array([np.mean(doy_returns[d]) for d in sorted_doys])
+    avg_rets = np.array([sum(doy_returns[d]) / len(doy_returns[d]) for d in sorted_doys])
     avg_doys = np.array(sorted_doys)
     
     # First trading day should have 0 return (no prior day to compare)
     avg_rets[0] = 0.0
     
     # Build date labels from DOY using a reference non-leap year
-    month_abbrs = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    date_labels = []
-    for doy in sorted_doys:
-        ref_date = dt.date(2023, 1, 1) + dt.timedelta(days=doy - 1)
-        date_labels.append(f"{month_abbrs[ref_date.month]}-{ref_date.day}")
+    date_labels = _DOY_LABEL_TABLE[avg_doys].tolist()
     
     return avg_rets, avg_doys, date_labels
 
@@ -2234,11 +2671,9 @@ def get_window_backtest_average(
     # Build trades info (based on detected windows)
     trades_info = []
     for w in windows:
-        ref_date_start = dt.date(2023, 1, 1) + dt.timedelta(days=w.start_day - 1)
-        ref_date_end = dt.date(2023, 1, 1) + dt.timedelta(days=w.end_day - 1)
         trades_info.append({
-            "entry_date": f"{calendar.month_abbr[ref_date_start.month]}-{ref_date_start.day}",
-            "exit_date": f"{calendar.month_abbr[ref_date_end.month]}-{ref_date_end.day}",
+            "entry_date": w.start_date_str,
+            "exit_date": w.end_date_str,
             "days": w.length,
         })
     
@@ -2469,8 +2904,8 @@ def _build_equity_curve(
     for tmpl, (start_day, end_day) in zip(templates, day_ranges):
         start_date = dt.date(year, 1, 1) + dt.timedelta(days=start_day - 1)
         end_date = dt.date(year, 1, 1) + dt.timedelta(days=end_day - 1)
-        entry_str = f"{calendar.month_abbr[start_date.month]}-{start_date.day}"
-        exit_str = f"{calendar.month_abbr[end_date.month]}-{end_date.day}"
+        entry_str = f"{MONTH_NAMES[start_date.month - 1]}-{start_date.day}"
+        exit_str = f"{MONTH_NAMES[end_date.month - 1]}-{end_date.day}"
         
         all_trading_periods.append({
             "entry_date": entry_str,
@@ -2497,10 +2932,9 @@ def _build_equity_curve(
     # Track per-stock close prices for stop-loss (keyed by df id)
     df_id_to_closes: dict[int, np.ndarray] = {}
     
-    for w_idx, (entry_ts, exit_ts) in enumerate(ts_ranges):
-        entry_np = np.datetime64(entry_ts)
-        exit_np = np.datetime64(exit_ts)
-        window_masks[w_idx] = (idx_values >= entry_np) & (idx_values <= exit_np)
+    w_starts, w_stops = trading_range_positions(idx_values, ts_ranges)
+    for w_idx in range(n_windows):
+        window_masks[w_idx, w_starts[w_idx]:w_stops[w_idx]] = True
         
         # Get this window's stock data
         if window_dfs is not None:
@@ -2545,16 +2979,18 @@ def _build_equity_curve(
             else:
                 w_closes = year_data["Close"].values
             
+            # Only the window's own [start, stop) span can be active; a
+            # window dropped for lack of data has its whole mask cleared
+            w_start, w_stop = int(w_starts[w_idx]), int(w_stops[w_idx])
+            if w_start >= w_stop or not window_masks[w_idx, w_start]:
+                continue
+            
             entry_price = np.nan
             stopped_out = False
             reentered = False
             stop_price = 0.0
             
-            for d in range(n_days):
-                if not window_masks[w_idx, d]:
-                    # Outside the original window range — skip
-                    continue
-                
+            for d in range(w_start, w_stop):
                 close = w_closes[d]
                 if np.isnan(close):
                     continue
@@ -2645,11 +3081,7 @@ def _build_equity_curve(
     bh_curve = (np.cumprod(1.0 + bh_blended) - 1.0) * 100.0
     
     # Vectorized date formatting
-    months = year_data.index.month.values
-    days = year_data.index.day.values
-    month_abbrs = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    dates = [f"{month_abbrs[m]}-{d}" for m, d in zip(months.tolist(), days.tolist())]
+    dates = _day_labels(year_data.index)
     
     return {
         "combined_curve": combined_curve.tolist(),
@@ -2752,15 +3184,11 @@ def get_basket_backtest_average(
     n_days = len(avg_doys)
     
     # Build trades info from templates
-    month_abbrs = ['', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
-                   'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
     trades_info = []
     for tmpl, (start_day, end_day) in zip(templates, day_ranges):
-        ref_start = dt.date(2023, 1, 1) + dt.timedelta(days=start_day - 1)
-        ref_end = dt.date(2023, 1, 1) + dt.timedelta(days=end_day - 1)
         trades_info.append({
-            "entry_date": f"{month_abbrs[ref_start.month]}-{ref_start.day}",
-            "exit_date": f"{month_abbrs[ref_end.month]}-{ref_end.day}",
+            "entry_date": _DOY_LABEL_TABLE[start_day],
+            "exit_date": _DOY_LABEL_TABLE[end_day],
             "symbol": tmpl["symbol"],
         })
     
@@ -2864,11 +3292,6 @@ def export_trading_calendar_csv(strategies: list[dict], align_windows: bool = Fa
     Returns:
         CSV content string
     """
-    import io
-    import calendar as cal
-    
-    month_order = {cal.month_abbr[i]: i for i in range(1, 13)}
-    
     # Collect all windows across strategies
     # Each window: (start_doy, end_doy, stock_name)
     all_windows: list[tuple[int, int, str]] = []
@@ -2976,23 +3399,24 @@ def export_trading_calendar_csv(strategies: list[dict], align_windows: bool = Fa
         
         # Convert doy to date string
         month, day = date_from_day_of_year(doy)
-        date_str = f"{cal.month_abbr[month]}-{day}"
+        date_str = f"{MONTH_NAMES[month - 1]}-{day}"
         
         rows.append((date_str, allocs, action_desc))
     
     # Generate CSV
     output = io.StringIO()
     
+    writer = csv.writer(output, lineterminator="\n")
+    
     # Header
-    header = ["Date"] + stock_names + ["Action"]
-    output.write(",".join(header) + "\n")
+    writer.writerow(["Date"] + stock_names + ["Action"])
     
-    for date_str, allocs, action_desc in rows:
-        cells = [date_str]
-        for name in stock_names:
-            cells.append(allocs.get(name, ""))
-        cells.append(action_desc)
-        output.write(",".join(cells) + "\n")
+    # Action descriptions list several names ("Enter A, B"), so let the
+    # writer quote them instead of splitting them across columns
+    writer.writerows(
+        [date_str] + [allocs.get(name, "") for name in stock_names] + [action_desc]
+        for date_str, allocs, action_desc in rows
+    )
     
     return output.getvalue()
 
@@ -3015,9 +3439,6 @@ def export_trading_simulation_csv(strategies: list[dict], align_windows: bool =
     Returns:
         CSV content string for import into Google Sheets
     """
-    import io
-    import csv
-    
     # Collect all windows across strategies
     all_windows: list[tuple[int, int, str]] = []
     stock_names: list[str] = []  # ordered unique stock names (cleaned)
@@ -3462,8 +3883,11 @@ def _compute_sharpe(annual_returns: list[float]) -> tuple[float, str]:
     """
     if len(annual_returns) < 2:
         return 0.0, "poor"
-    mean_r = float(np.mean(annual_returns))
-    std_r = float(np.std(annual_returns, ddof=1))
+    # Plain Python on this short list avoids ndarray allocation and ufunc
+    # dispatch for what is a handful of floats
+    n = len(annual_returns)
+    mean_r = sum(annual_returns) / n
+    std_r = math.sqrt(sum((r - mean_r) ** 2 for r in annual_returns) / (n - 1))
     if std_r == 0:
         sharpe = 0.0 if mean_r == 0 else float("inf")
     else:
@@ -3545,16 +3969,16 @@ def get_window_bar_data(
         daily_ret[0] = 0.0
         daily_ret[1:] = closes[1:] / closes[:-1] - 1.0
 
-        bh_return = float((np.cumprod(1.0 + daily_ret)[-1] - 1.0) * 100.0)
+        # Compounded daily returns telescope to last close / first close
+        bh_return = float((closes[-1] / closes[0] - 1.0) * 100.0)
 
         idx_values = year_data.index.values
-        in_market = np.zeros(len(idx_values), dtype=bool)
-        for w in windows:
-            start_date = dt.date(year, 1, 1) + dt.timedelta(days=w.start_day - 1)
-            end_date = dt.date(year, 1, 1) + dt.timedelta(days=w.end_day - 1)
-            entry_np = np.datetime64(pd.Timestamp(start_date))
-            exit_np = np.datetime64(pd.Timestamp(end_date))
-            in_market |= (idx_values >= entry_np) & (idx_values <= exit_np)
+        jan1 = dt.date(year, 1, 1)
+        w_starts, w_stops = trading_range_positions(idx_values, [
+            (jan1 + dt.timedelta(days=w.start_day - 1), jan1 + dt.timedelta(days=w.end_day - 1))
+            for w in windows
+        ])
+        in_market = _positions_mask(len(idx_values), w_starts, w_stops)
 
         # Apply entry stop-loss per window
         if stop_loss_pct > 0:
@@ -3564,19 +3988,10 @@ def get_window_bar_data(
             )
 
         masked_ret = np.where(in_market, daily_ret, 0.0)
-        strategy_return = float(
-            (np.cumprod(1.0 + masked_ret)[-1] - 1.0) * 100.0,
-        )
+        strategy_return = float((np.prod(1.0 + masked_ret) - 1.0) * 100.0)
 
-        # Count round-trip trades (windows active this year)
-        n_trades = 0
-        for w in windows:
-            start_date = dt.date(year, 1, 1) + dt.timedelta(days=w.start_day - 1)
-            end_date = dt.date(year, 1, 1) + dt.timedelta(days=w.end_day - 1)
-            entry_np = np.datetime64(pd.Timestamp(start_date))
-            exit_np = np.datetime64(pd.Timestamp(end_date))
-            if np.any((idx_values >= entry_np) & (idx_values <= exit_np)):
-                n_trades += 1
+        # Count round-trip trades (windows with trading days this year)
+        n_trades = int(np.count_nonzero(w_starts < w_stops))
 
         # Apply fees: each round-trip has 2 transactions (buy + sell),
         # each costing fees_pct% of the trade value
@@ -0,0 +1,130 @@
+"""
+Numba-compiled kernels for the seasonal statistics hot paths.
+
+Optional: backend.py imports this module only if numba is installed and
+falls back to equivalent NumPy code otherwise. Both paths take a
+(n_periods, n_years) float64 returns matrix with NaN marking missing years.
+
+Each kernel is declared with its signature, so it is compiled (or loaded
+from numba's on-disk cache) when this module is imported rather than on
+the first request that reaches it.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, types
+
+# The kernels only read the returns matrix, so it is typed read-only: that
+# accepts the read-only matrix generate_seasonal_data shares between
+# memoized rows as well as ordinary writable arrays
+_RETURNS = types.Array(types.float64, 2, "A", readonly=True)
+_STATS_OUT = types.Tuple((types.int64[:], types.float64[:], types.float64[:], types.boolean[:], types.float64[:]))
+
+
+@njit(_STATS_OUT(_RETURNS), cache=True)
+def seasonal_stats(returns):
+    """
+    Per-row (counts, average, trend %, is_bullish, expected value).
+    Rows without any data get count 0 and NaN statistics.
+    """
+    n_rows, n_years = returns.shape
+    counts = np.zeros(n_rows, dtype=np.int64)
+    avg = np.full(n_rows, np.nan)
+    trend = np.full(n_rows, np.nan)
+    is_bull = np.zeros(n_rows, dtype=np.bool_)
+    ev = np.full(n_rows, np.nan)
+    for i in range(n_rows):
+        total = 0.0
+        count = 0
+        green = 0
+        for j in range(n_years):
+            r = returns[i, j]
+            if not np.isnan(r):
+                total += r
+                count += 1
+                if r >= 0:
+                    green += 1
+        counts[i] = count
+        if count == 0:
+            continue
+        avg[i] = total / count
+        green_pct = (green / count) * 100
+        red_pct = ((count - green) / count) * 100
+        if green_pct >= red_pct:
+            trend[i] = green_pct
+            is_bull[i] = True
+            ev[i] = abs(avg[i]) * (green_pct / 100)
+        else:
+            trend[i] = red_pct
+            ev[i] = -(abs(avg[i]) * (red_pct / 100))
+    return counts, avg, trend, is_bull, ev
+
+
+@njit("Tuple((i8[:], i8[:], b1[:], f8[:]))(f8[:], f8[:], f8, i8)", cache=True)
+def detect_runs(ev, trend, threshold_pct, min_length):
+    """
+    Runs of consecutive same-direction periods (see backend.detect_runs).
+    Returns (starts, ends, is_bullish, ev_sums) for runs of at least
+    min_length periods; NaN EV or trend below threshold is neutral.
+    """
+    n = ev.shape[0]
+    starts = np.empty(n, dtype=np.int64)
+    ends = np.empty(n, dtype=np.int64)
+    bulls = np.empty(n, dtype=np.bool_)
+    sums = np.empty(n, dtype=np.float64)
+    n_runs = 0
+    run_start = 0
+    run_dir = 0  # +1 bullish, -1 bearish, 0 no open run
+    run_sum = 0.0
+    for i in range(n + 1):
+        if i == n or np.isnan(ev[i]) or trend[i] < threshold_pct:
+            d = 0
+        elif ev[i] >= 0:
+            d = 1
+        else:
+            d = -1
+        if d != 0 and d == run_dir:
+            run_sum += ev[i]
+            continue
+        # Direction changed: close the open run if it is long enough
+        if run_dir != 0 and i - run_start >= min_length:
+            starts[n_runs] = run_start
+            ends[n_runs] = i - 1
+            bulls[n_runs] = run_dir > 0
+            sums[n_runs] = run_sum
+            n_runs += 1
+        run_dir = d
+        run_start = i
+        run_sum = ev[i] if d != 0 else 0.0
+    return starts[:n_runs], ends[:n_runs], bulls[:n_runs], sums[:n_runs]
+
+
+_COMPOUND_OUT = types.Tuple((types.float64[:, :], types.boolean[:, :], types.float64[:]))
+
+
+@njit(_COMPOUND_OUT(_RETURNS, types.int64[:], types.int64[:]), cache=True)
+def compound_runs(returns, starts, ends):
+    """
+    Compounded growth of each run (rows starts[k]..ends[k]) in every year.
+    Returns (growth, traded, buy_hold): growth and traded have shape
+    (n_runs, n_years), with traded False for years where none of the run's
+    periods has data; buy_hold is the growth over all rows.
+    """
+    n_rows, n_years = returns.shape
+    n_runs = starts.shape[0]
+    growth = np.ones((n_runs, n_years))
+    traded = np.zeros((n_runs, n_years), dtype=np.bool_)
+    for k in range(n_runs):
+        for i in range(starts[k], ends[k] + 1):
+            for j in range(n_years):
+                r = returns[i, j]
+                if not np.isnan(r):
+                    growth[k, j] *= 1 + r / 100
+                    traded[k, j] = True
+    buy_hold = np.ones(n_years)
+    for i in range(n_rows):
+        for j in range(n_years):
+            r = returns[i, j]
+            if not np.isnan(r):
+                buy_hold[j] *= 1 + r / 100
+    return growth, traded, buy_hold
@@ -309,66 +309,30 @@
             const headerRow = statsTable.querySelector('thead tr');
             headerRow.innerHTML = '<th class="col-period">Period</th><th class="col-days">Days</th><th class="col-return">Return%</th><th class="col-win">Win%</th><th class="col-yield">bps/day</th>';
             
-            // Add year columns from first window if available
-            if (windows.length > 0) {
-                const years = Object.keys(windows[0].year_returns).sort().reverse();
-                years.forEach(year => {
-                    headerRow.innerHTML += `<th class="col-year">${year}</th>`;
-                });
-            }
+            // Year columns come from the first window; every window shares them
+            const years = windows.length > 0 ? Object.keys(windows[0].year_returns).sort().reverse() : [];
+            headerRow.innerHTML += years.map(year => `<th class="col-year">${year}</th>`).join('');
             
-            // Build body
+            // Build body: one markup string per row, parsed once
             const tbody = statsTable.querySelector('tbody');
-            tbody.innerHTML = '';
-            
-            windows.forEach((w) => {
-                const tr = document.createElement('tr');
-                
-                // Period column
-                tr.innerHTML = `<td class="col-period">${w.start_date} - ${w.end_date}</td>`;
-                
-                // Days
-                const daysCell = document.createElement('td');
-                daysCell.className = 'col-days';
-                daysCell.textContent = w.length;
-                tr.appendChild(daysCell);
-                
-                // Return%
-                const returnCell = document.createElement('td');
-                returnCell.className = 'col-return ' + (w.avg_return >= 0 ? 'positive' : 'negative');
-                returnCell.textContent = w.avg_return.toFixed(1) + '%';
-                tr.appendChild(returnCell);
-                
-                // Win%
-                const winCell = document.createElement('td');
-                winCell.className = 'col-win';
-                winCell.textContent = w.win_rate + '%';
-                tr.appendChild(winCell);
-                
-                // bps/day
-                const yieldCell = document.createElement('td');
-                yieldCell.className = 'col-yield ' + (w.yield_per_day >= 0 ? 'positive' : 'negative');
-                yieldCell.textContent = w.yield_per_day.toFixed(1);
-                tr.appendChild(yieldCell);
-                
-                // Year returns
-                const years = Object.keys(w.year_returns).sort().reverse();
+            tbody.innerHTML = windows.map((w) => {
+                const cells = [
+                    `<td class="col-period">${w.start_date} - ${w.end_date}</td>`,
+                    `<td class="col-days">${w.length}</td>`,
+                    `<td class="col-return ${w.avg_return >= 0 ? 'positive' : 'negative'}">${w.avg_return.toFixed(1)}%</td>`,
+                    `<td class="col-win">${w.win_rate}%</td>`,
+                    `<td class="col-yield ${w.yield_per_day >= 0 ? 'positive' : 'negative'}">${w.yield_per_day.toFixed(1)}</td>`
+                ];
                 years.forEach(year => {
                     const ret = w.year_returns[year];
-                    const td = document.createElement('td');
-                    td.className = 'col-year';
                     if (ret !== null) {
-                        td.textContent = ret.toFixed(1) + '%';
-                        td.className += ret >= 0 ? ' positive' : ' negative';
+                        cells.push(`<td class="col-year ${ret >= 0 ? 'positive' : 'negative'}">${ret.toFixed(1)}%</td>`);
                     } else {
-                        td.textContent = '-';
-                        td.className += ' na';
+                        cells.push('<td class="col-year na">-</td>');
                     }
-                    tr.appendChild(td);
                 });
-                
-                tbody.appendChild(tr);
-            });
+                return `<tr>${cells.join('')}</tr>`;
+            }).join('');
             
             // Add totals row
             if (windows.length > 0) {
@@ -380,14 +344,7 @@
                     <td class="col-return ${total_return >= 0 ? 'positive' : 'negative'}"><strong>${total_return.toFixed(1)}%</strong></td>
                     <td class="col-win"></td>
                     <td class="col-yield"></td>
-                `;
-                // Add empty cells for year columns
-                if (windows.length > 0) {
-                    const years = Object.keys(windows[0].year_returns).sort().reverse();
-                    years.forEach(() => {
-                        totalTr.innerHTML += '<td class="col-year"></td>';
-                    });
-                }
+                ` + '<td class="col-year"></td>'.repeat(years.length);
                 tbody.appendChild(totalTr);
                 
                 // Plan overlap row
@@ -395,7 +352,7 @@
                     const od = state.overlapData;
                     const overlapTr = document.createElement('tr');
                     overlapTr.style.cssText = 'border-top:1px solid #444;';
-                    const colSpan = 5 + Object.keys(windows[0].year_returns).length;
+                    const colSpan = 5 + years.length;
                     const overlapPct = od.stock_days > 0 ? Math.round(od.overlap_days / od.stock_days * 100) : 0;
                     overlapTr.innerHTML = `
                         <td colspan="${colSpan}" style="color:#aa88dd;font-size:11px;padding:6px 8px;">
@@ -905,9 +862,8 @@
             // Build header with fixed column widths
             const headerRow = tradesTable.querySelector('thead tr');
             headerRow.innerHTML = '<th class="col-entry">Entry</th><th class="col-exit">Exit</th><th class="col-profit">Profit</th><th class="col-days">Days</th><th class="col-bps">Yield/day</th>';
-            years.slice().reverse().forEach(year => {
-                headerRow.innerHTML += `<th class="col-year">${year}</th>`;
-            });
+            const yearsDesc = years.slice().reverse();
+            headerRow.innerHTML += yearsDesc.map(year => `<th class="col-year">${year}</th>`).join('');
             
             // Build body
             const tbody = tradesTable.querySelector('tbody');
@@ -921,28 +877,27 @@
                 return;
             }
             
-            trades.forEach(trade => {
-                const tr = document.createElement('tr');
-                
-                tr.innerHTML = `<td class="col-entry">${trade.entry_date}</td>`;
-                tr.innerHTML += `<td class="col-exit">${trade.exit_date}</td>`;
-                tr.innerHTML += `<td class="col-profit ${trade.avg_profit >= 0 ? 'positive' : 'negative'}">${Math.abs(trade.avg_profit).toFixed(1)}%</td>`;
-                tr.innerHTML += `<td class="col-days">${trade.days}</td>`;
+            // One markup string per row, parsed once
+            tbody.innerHTML = trades.map(trade => {
                 const bpsPerDay = (trade.avg_profit / trade.days) * 100;
-                tr.innerHTML += `<td class="col-bps ${bpsPerDay >= 0 ? 'positive' : 'negative'}">${Math.abs(bpsPerDay).toFixed(1)}</td>`;
-                
-                years.slice().reverse().forEach(year => {
+                const cells = [
+                    `<td class="col-entry">${trade.entry_date}</td>`,
+                    `<td class="col-exit">${trade.exit_date}</td>`,
+                    `<td class="col-profit ${trade.avg_profit >= 0 ? 'positive' : 'negative'}">${Math.abs(trade.avg_profit).toFixed(1)}%</td>`,
+                    `<td class="col-days">${trade.days}</td>`,
+                    `<td class="col-bps ${bpsPerDay >= 0 ? 'positive' : 'negative'}">${Math.abs(bpsPerDay).toFixed(1)}</td>`
+                ];
+                yearsDesc.forEach(year => {
                     const val = trade.years[year];
                     if (val !== null) {
                         const cls = val >= 0 ? 'positive' : 'negative';
-                        tr.innerHTML += `<td class="col-year ${cls}">${Math.abs(val).toFixed(1)}%</td>`;
+                        cells.push(`<td class="col-year ${cls}">${Math.abs(val).toFixed(1)}%</td>`);
                     } else {
-                        tr.innerHTML += `<td class="col-year dim">-</td>`;
+                        cells.push('<td class="col-year dim">-</td>');
                     }
                 });
-                
-                tbody.appendChild(tr);
-            });
+                return `<tr>${cells.join('')}</tr>`;
+            }).join('');
             
             // Render summary as table
             const profitClass = sum.avg_profit >= 0 ? 'positive' : 'negative';
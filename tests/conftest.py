@@ -11,6 +11,9 @@ import backend
 
 
 @pytest.fixture(autouse=True)
-def clear_window_cache():
-    """Clear the window detection cache before each test to avoid cross-test pollution."""
+def clear_backend_caches():
+    """Clear backend memo caches before each test to avoid cross-test pollution."""
     backend._window_detect_cache.clear()
+    backend._basket_cache.clear()
+    backend._analysis_cache.clear()
+    backend._rows_cache.clear()
@@ -122,6 +122,42 @@ class TestParseSymbols:
         assert parse_symbols("  RELIANCE.NS  ,  TCS.NS  ") == ["RELIANCE.NS", "TCS.NS"]
 
 
+# ============================================================================
+# Tests: load_stock_list / search_symbols
+# ============================================================================
+
+
+class TestStockList:
+    @pytest.fixture
+    def stocks_file(self, tmp_path, monkeypatch):
+        import backend
+        path = tmp_path / "nse_stocks.csv"
+        path.write_text(
+            "symbol,name\n"
+            "RELIANCE.NS,Reliance Industries Limited\n"
+            'BBNPNBETF.NS,"[ETF] Baroda BNP Paribas, Nifty Bank ETF"\n'
+            "TCS.NS,Tata Consultancy Services Limited\n",
+            encoding="utf-8",
+        )
+        monkeypatch.setattr(backend, "STOCKS_FILE", path)
+        return path
+
+    def test_quoted_names_parsed(self, stocks_file):
+        from backend import load_stock_list
+        stocks = load_stock_list()
+        assert stocks[1] == ("BBNPNBETF.NS", "[ETF] Baroda BNP Paribas, Nifty Bank ETF")
+        assert len(stocks) == 3
+
+    def test_search_matches_symbol_and_name(self, stocks_file):
+        from backend import search_symbols
+        assert [m["symbol"] for m in search_symbols("tcs")] == ["TCS.NS"]
+        assert [m["symbol"] for m in search_symbols("limited")] == ["RELIANCE.NS", "TCS.NS"]
+        assert search_symbols("limited", max_results=1) == [
+            {"symbol": "RELIANCE.NS", "name": "Reliance Industries Limited"}
+        ]
+        assert search_symbols("   ") == []
+
+
 # ============================================================================
 # Tests: _normalize_df
 # ============================================================================
@@ -138,6 +174,9 @@ class TestNormalizeDf:
         assert list(result.columns) == ["Open", "High", "Low", "Close"]
         assert len(result) > 0
 
+    def test_normalized_frame_returned_as_is(self, sample_ohlc_df):
+        assert _normalize_df(sample_ohlc_df) is sample_ohlc_df
+
     def test_lowercase_columns(self):
         df = pd.DataFrame(
             {"open": [100], "high": [105], "low": [95], "close": [102]},
@@ -243,6 +282,19 @@ class TestTradingDayHelpers:
         result = prev_trading_day(trading_index, pd.Timestamp("2023-12-31"))
         assert result is None
 
+    def test_trading_range_positions_and_mask(self, trading_index):
+        from backend import trading_range_positions, _positions_mask
+        ranges = [
+            (pd.Timestamp("2024-01-02"), pd.Timestamp("2024-01-03")),
+            (dt.date(2024, 1, 3), dt.date(2024, 1, 4)),   # overlaps the first
+            (pd.Timestamp("2024-01-06"), pd.Timestamp("2024-01-07")),  # weekend: empty
+        ]
+        starts, stops = trading_range_positions(trading_index.values, ranges)
+        assert starts.tolist() == [1, 2, 5]
+        assert stops.tolist() == [3, 4, 5]
+        mask = _positions_mask(len(trading_index), starts, stops)
+        assert mask.tolist() == [False, True, True, True, False]
+
 
 # ============================================================================
 # Tests: get_first_monday
@@ -323,6 +375,120 @@ class TestComputeWindowReturn:
         assert result is None
 
 
+# ============================================================================
+# Tests: load_symbol_data
+# ============================================================================
+
+
+class TestLoadSymbolData:
+    @pytest.fixture
+    def data_dir(self, tmp_path, monkeypatch):
+        import backend
+        monkeypatch.setattr(backend, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(backend, "BASKETS_DIR", tmp_path / "baskets")
+        monkeypatch.setattr(backend, "_symbol_cache", {})
+        return tmp_path
+
+    @pytest.fixture
+    def recent_df(self) -> pd.DataFrame:
+        dates = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=10)
+        prices = np.linspace(100.0, 110.0, len(dates))
+        return pd.DataFrame(
+            {"Open": prices, "High": prices + 1, "Low": prices - 1, "Close": prices},
+            index=dates,
+        )
+
+    @patch("backend._download_symbol")
+    def test_up_to_date_cache_is_not_rewritten(self, mock_download, data_dir, recent_df):
+        from backend import load_symbol_data
+        cache_path = data_dir / "TEST.NS.parquet"
+        recent_df.to_parquet(cache_path)
+        before = cache_path.read_bytes()
+        result = load_symbol_data("TEST.NS")
+        mock_download.assert_not_called()
+        assert len(result) == len(recent_df)
+        assert cache_path.read_bytes() == before
+
+    @patch("backend._download_symbol")
+    def test_repeat_call_served_from_memory(self, mock_download, data_dir, recent_df):
+        from backend import load_symbol_data
+        mock_download.return_value = recent_df
+        first = load_symbol_data("TEST.NS")
+        assert mock_download.call_count == 1
+        assert (data_dir / "TEST.NS.parquet").exists()
+        second = load_symbol_data("TEST.NS")
+        assert second is first
+        assert mock_download.call_count == 1
+
+    @patch("backend._download_symbol")
+    def test_incremental_update_appends_new_rows_only(self, mock_download, data_dir, recent_df):
+        from backend import load_symbol_data
+        cache_path = data_dir / "TEST.NS.parquet"
+        recent_df.iloc[:-3].to_parquet(cache_path)
+        # Download overlaps the cached range by one day
+        mock_download.return_value = recent_df.iloc[-4:]
+        result = load_symbol_data("TEST.NS")
+        assert list(result.index) == list(recent_df.index)
+        assert result.index.is_unique
+
+    @patch("backend._download_symbol")
+    def test_empty_incremental_download_keeps_cache(self, mock_download, data_dir, recent_df):
+        from backend import load_symbol_data
+        cache_path = data_dir / "TEST.NS.parquet"
+        recent_df.iloc[:-3].to_parquet(cache_path)
+        before = cache_path.read_bytes()
+        mock_download.return_value = pd.DataFrame()
+        result = load_symbol_data("TEST.NS")
+        assert len(result) == len(recent_df) - 3
+        assert cache_path.read_bytes() == before
+
+    @patch("backend._download_symbol")
+    def test_legacy_csv_cache_migrated_to_parquet(self, mock_download, data_dir, recent_df):
+        from backend import load_symbol_data
+        recent_df.to_csv(data_dir / "TEST.NS.csv")
+        result = load_symbol_data("TEST.NS")
+        mock_download.assert_not_called()
+        assert len(result) == len(recent_df)
+        migrated = pd.read_parquet(data_dir / "TEST.NS.parquet")
+        assert list(migrated.index) == list(recent_df.index)
+        np.testing.assert_allclose(migrated["Close"], recent_df["Close"])
+
+    @patch("backend._download_symbol")
+    def test_unsorted_legacy_csv_is_sorted_before_freshness_check(self, mock_download, data_dir, recent_df):
+        from backend import load_symbol_data
+        recent_df.iloc[::-1].to_csv(data_dir / "TEST.NS.csv")
+        result = load_symbol_data("TEST.NS")
+        mock_download.assert_not_called()
+        assert result.index.is_monotonic_increasing
+
+    @patch("yfinance.download")
+    def test_load_many_symbols_single_download(self, mock_yf, data_dir, recent_df):
+        from backend import load_many_symbols
+        # A.NS is up to date on disk, B.NS and C.NS have no cache
+        recent_df.to_parquet(data_dir / "A.NS.parquet")
+        mock_yf.return_value = pd.concat(
+            {"B.NS": recent_df, "C.NS": recent_df * 2}, axis=1
+        )
+        loaded = load_many_symbols(["A.NS", "B.NS", "C.NS", "B.NS"])
+        mock_yf.assert_called_once()
+        assert mock_yf.call_args.args[0] == ["B.NS", "C.NS"]
+        assert mock_yf.call_args.kwargs["period"] == "max"
+        assert set(loaded) == {"A.NS", "B.NS", "C.NS"}
+        np.testing.assert_allclose(loaded["C.NS"]["Close"], recent_df["Close"] * 2)
+        assert (data_dir / "C.NS.parquet").exists()
+
+    @patch("yfinance.download")
+    def test_load_many_symbols_flat_single_download(self, mock_yf, data_dir, recent_df):
+        from backend import load_many_symbols
+        # Older yfinance returns flat columns when only one ticker is requested
+        recent_df.to_parquet(data_dir / "A.NS.parquet")
+        mock_yf.return_value = recent_df * 2
+        loaded = load_many_symbols(["A.NS", "B.NS"])
+        assert mock_yf.call_args.args[0] == ["B.NS"]
+        np.testing.assert_allclose(loaded["B.NS"]["Close"], recent_df["Close"] * 2)
+        assert not pd.read_parquet(data_dir / "B.NS.parquet").empty
+
+
 # ============================================================================
 # Tests: SeasonalRow
 # ============================================================================
@@ -384,6 +550,34 @@ class TestSeasonalRow:
         row = SeasonalRow(label="Week 1")
         assert row.trend_pct is None
 
+    def test_year_returns_round_trip(self):
+        row = SeasonalRow(label="Week 1")
+        row.year_returns = {2022: 1.5, 2023: None, 2024: -2.0}
+        assert row.years == (2022, 2023, 2024)
+        assert row.year_returns == {2022: 1.5, 2023: None, 2024: -2.0}
+
+    def test_get_year_return(self):
+        row = SeasonalRow(label="Week 1")
+        row.year_returns = {2022: 1.5, 2023: None}
+        assert row.get_year_return(2022) == 1.5
+        assert row.get_year_return(2023) is None
+        assert row.get_year_return(1999) is None
+
+    def test_year_returns_constructor_kwarg(self):
+        row = SeasonalRow(label="Week 1", year_returns={2022: 1.5, 2023: None})
+        assert row.years == (2022, 2023)
+        assert row.year_returns == {2022: 1.5, 2023: None}
+
+    def test_year_returns_view_is_read_only(self):
+        row = SeasonalRow(label="Week 1", year_returns={2022: 1.5})
+        with pytest.raises(TypeError):
+            row.year_returns[2022] = 3.0
+
+    def test_equality_compares_returns(self):
+        row = SeasonalRow(label="Week 1", year_returns={2022: 1.5, 2023: None})
+        assert row == SeasonalRow(label="Week 1", year_returns={2022: 1.5, 2023: None})
+        assert row != SeasonalRow(label="Week 1", year_returns={2022: 1.5, 2023: 2.0})
+
 
 # ============================================================================
 # Tests: generate_seasonal_data
@@ -417,6 +611,12 @@ class TestGenerateSeasonalData:
         row = result[0]
         assert len(row.year_returns) == 3
 
+    def test_row_returns_are_read_only(self, sample_ohlc_df):
+        # Rows are memoized and share one returns matrix
+        result = generate_seasonal_data(sample_ohlc_df, "weekly", 0, 3)
+        with pytest.raises(ValueError):
+            result[0].returns[0] = 1.0
+
 
 # ============================================================================
 # Tests: detect_runs and build_run_map
@@ -553,6 +753,24 @@ class TestBuildRunMap:
         assert run_membership[5] is False
 
 
+class TestSimulateAllYears:
+    def test_trades_indexed_by_labels(self):
+        from backend import simulate_all_years
+        rows = [
+            SeasonalRow(label="Jan", years=(2020, 2021), returns=np.array([2.0, 1.0])),
+            SeasonalRow(label="Feb", years=(2020, 2021), returns=np.array([3.0, np.nan])),
+            SeasonalRow(label="Mar", years=(2020, 2021), returns=np.array([-1.0, -2.0])),
+        ]
+        runs = [RunInfo(start_idx=0, end_idx=1, is_bullish=True, ev_sum=2.0)]
+        results = simulate_all_years(rows, runs, [2020, 2021], "monthly")
+        for year in (2020, 2021):
+            result = results[year]
+            assert list(result.trades_by_key) == [("Jan", "Feb")]
+            assert result.trades_by_key[("Jan", "Feb")] is result.trades[0]
+        assert results[2020].trades[0].profit_pct == pytest.approx(5.06)
+        assert results[2021].trades[0].profit_pct == pytest.approx(1.0)
+
+
 class TestDetectRunsThreshold:
     """Tests for threshold functionality in detect_runs."""
 
@@ -672,6 +890,12 @@ class TestGetPeriodDateLabel:
         # Week 3 starts Jan 15, +6+3 = +9 days = Jan 24
         assert result == "Jan-24"
 
+    def test_month_day_matches_label(self):
+        """period_month_day gives the (month, day) the label is formatted from."""
+        from backend import period_month_day
+        assert period_month_day("Feb", "monthly", 5, is_entry=False) == (3, 5)
+        assert period_month_day("Week 5", "weekly", 2, is_entry=True) == (1, 31)
+
 
 # ============================================================================
 # Tests: Plan Save / Load
@@ -1203,3 +1427,94 @@ class TestGetBasketBarData:
         assert result["years"][0]["combined_return"] == 10.0
         assert result["years"][1]["combined_return"] == 5.0
         assert result["years"][2]["combined_return"] == -2.0
+
+
+# ============================================================================
+# Tests: analysis / basket memoization
+# ============================================================================
+
+
+class TestAnalysisCache:
+    @patch("backend.load_symbol_data")
+    def test_repeat_stats_request_reuses_analysis(self, mock_load, sample_ohlc_df):
+        from backend import get_stats
+        mock_load.return_value = sample_ohlc_df
+        with patch("backend.generate_seasonal_data", wraps=generate_seasonal_data) as spy:
+            first = get_stats(["TEST.NS"], "weekly", 0, 60)
+            second = get_stats(["TEST.NS"], "weekly", 0, 60)
+            assert spy.call_count == 1
+            get_stats(["TEST.NS"], "weekly", 1, 60)
+            assert spy.call_count == 2
+        assert first == second
+
+    @patch("backend.load_symbol_data")
+    def test_threshold_change_reuses_seasonal_rows(self, mock_load, sample_ohlc_df):
+        from backend import get_stats
+        mock_load.return_value = sample_ohlc_df
+        with patch("backend.generate_seasonal_data", wraps=generate_seasonal_data) as spy:
+            get_stats(["TEST.NS"], "weekly", 0, 60)
+            get_stats(["TEST.NS"], "weekly", 0, 75)
+            assert spy.call_count == 1
+
+    @patch("backend.load_symbol_data")
+    def test_new_data_invalidates_analysis(self, mock_load, sample_ohlc_df):
+        from backend import get_stats
+        mock_load.return_value = sample_ohlc_df
+        get_stats(["TEST.NS"], "weekly", 0, 60)
+        mock_load.return_value = sample_ohlc_df.copy()
+        with patch("backend.generate_seasonal_data", wraps=generate_seasonal_data) as spy:
+            get_stats(["TEST.NS"], "weekly", 0, 60)
+            assert spy.call_count == 1
+
+    @patch("backend.load_many_symbols")
+    def test_basket_reused_while_components_unchanged(self, mock_load, sample_ohlc_df):
+        from backend import synthesize_basket
+        mock_load.return_value = {"A.NS": sample_ohlc_df, "B.NS": sample_ohlc_df * 1.1}
+        first = synthesize_basket(["A.NS", "B.NS"])
+        assert synthesize_basket(["A.NS", "B.NS"]) is first
+        mock_load.return_value = {"A.NS": sample_ohlc_df, "B.NS": sample_ohlc_df * 1.2}
+        assert synthesize_basket(["A.NS", "B.NS"]) is not first
+
+    @patch("backend.load_many_symbols")
+    def test_basket_cache_is_bounded(self, mock_load, sample_ohlc_df):
+        import backend
+        mock_load.side_effect = lambda symbols: {s: sample_ohlc_df for s in symbols}
+        for i in range(backend.BASKET_CACHE_SIZE + 3):
+            backend.synthesize_basket([f"A{i}.NS", "B.NS"])
+        assert len(backend._basket_cache) == backend.BASKET_CACHE_SIZE
+        assert ("A0.NS", "B.NS") not in backend._basket_cache
+
+
+class TestExportTradingCalendarCsv:
+    @patch("backend.detect_sliding_windows")
+    @patch("backend.load_symbol_data")
+    def test_multi_name_actions_stay_in_one_column(self, mock_load, mock_detect, sample_ohlc_df):
+        import csv
+        import io
+        from backend import SlidingWindow, export_trading_calendar_csv
+        mock_load.return_value = sample_ohlc_df
+        mock_detect.return_value = [SlidingWindow(10, 40, 31, 2.0, 0.7, 1.4, 0.06, {})]
+        strategies = [
+            {"symbol": "AAA.NS", "window_size": 30, "threshold": 50},
+            {"symbol": "BBB.NS", "window_size": 30, "threshold": 50},
+        ]
+        rows = list(csv.reader(io.StringIO(export_trading_calendar_csv(strategies))))
+        assert rows[0] == ["Date", "AAA", "BBB", "Action"]
+        assert all(len(row) == 4 for row in rows)
+        assert rows[1] == ["Jan-10", "50%", "50%", "Enter AAA, BBB"]
+
+
+class TestExportStrategyCsv:
+    @patch("backend.load_symbol_data")
+    def test_matches_trades_without_simulating_years(self, mock_load, sample_ohlc_df):
+        from backend import export_strategy_csv, get_trades
+        mock_load.return_value = sample_ohlc_df
+        with patch("backend.simulate_all_years") as spy:
+            content = export_strategy_csv(["TEST.NS"], "weekly", 0, 50)
+            assert spy.call_count == 0
+        expected = []
+        for trade in get_trades(["TEST.NS"], "weekly", 0, 50)["trades"]:
+            expected.append(f"{trade['entry_date']},TEST,BUY")
+            expected.append(f"{trade['exit_date']},TEST,SELL")
+        assert expected
+        assert content.splitlines() == expected
@@ -0,0 +1,85 @@
+"""Tests that the optional numba kernels match the NumPy fallback."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+pytest.importorskip("numba")
+
+import backend
+from backend import _seasonal_row_stats, detect_runs, generate_seasonal_data
+
+
+@pytest.fixture
+def sample_rows():
+    dates = pd.bdate_range("2010-01-01", "2024-12-31")
+    rng = np.random.default_rng(42)
+    close = 100 * np.cumprod(1 + rng.normal(0.0003, 0.01, len(dates)))
+    df = pd.DataFrame(
+        {"Open": close, "High": close, "Low": close, "Close": close}, index=dates
+    )
+    return generate_seasonal_data(df, "weekly", 0, 15)
+
+
+@pytest.fixture
+def returns_matrix() -> np.ndarray:
+    rng = np.random.default_rng(7)
+    returns = rng.normal(0.2, 2.0, size=(53, 15))
+    returns[rng.random(returns.shape) < 0.1] = np.nan
+    returns[5] = np.nan  # A period with no data at all
+    returns[9] = 0.0     # Flat period: zero average
+    return returns
+
+
+def _with_numpy_fallback(monkeypatch, func, *args, **kwargs):
+    with monkeypatch.context() as m:
+        m.setattr(backend, "_nb", None)
+        return func(*args, **kwargs)
+
+
+class TestNumbaKernels:
+    def test_numba_backend_loaded(self):
+        assert backend._nb is not None
+
+    def test_seasonal_stats_match_fallback(self, monkeypatch, returns_matrix):
+        expected = _with_numpy_fallback(monkeypatch, _seasonal_row_stats, returns_matrix)
+        actual = _seasonal_row_stats(returns_matrix)
+        assert len(actual) == len(expected)
+        for got, want in zip(actual, expected):
+            if want[0] is None:
+                assert got == (None, None, None)
+                continue
+            assert got[0] == pytest.approx(want[0])
+            assert got[1][0] == pytest.approx(want[1][0])
+            assert got[1][1] == want[1][1]
+            assert got[2] == pytest.approx(want[2])
+
+    @pytest.mark.parametrize("threshold", [0, 50, 60, 80])
+    @pytest.mark.parametrize("min_length", [1, 2, 3])
+    def test_detect_runs_match_fallback(self, monkeypatch, sample_rows, threshold, min_length):
+        expected = _with_numpy_fallback(
+            monkeypatch, detect_runs, sample_rows, min_length=min_length, threshold_pct=threshold
+        )
+        actual = detect_runs(sample_rows, min_length=min_length, threshold_pct=threshold)
+        assert [(r.start_idx, r.end_idx, r.is_bullish) for r in actual] == [
+            (r.start_idx, r.end_idx, r.is_bullish) for r in expected
+        ]
+        for got, want in zip(actual, expected):
+            assert got.ev_sum == pytest.approx(want.ev_sum)
+
+    def test_compound_runs_match_fallback(self, monkeypatch, returns_matrix):
+        from backend import _compound_runs
+        starts = np.array([0, 4, 10, 30], dtype=np.int64)
+        ends = np.array([2, 6, 10, 52], dtype=np.int64)
+        expected = _with_numpy_fallback(monkeypatch, _compound_runs, returns_matrix, starts, ends)
+        actual = _compound_runs(returns_matrix, starts, ends)
+        for got, want in zip(actual, expected):
+            np.testing.assert_allclose(got, want)
+        np.testing.assert_array_equal(actual[1], expected[1])